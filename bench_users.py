@@ -0,0 +1,60 @@
+# Memory benchmark: per-user boost storage.
+# Compares the old dict-of-dicts records ({"points", "boosts": {vid: n}})
+# with run.User (__slots__ + array of video slots) for synthetic boosters.
+#
+#   python bench_users.py                 # 10k, 100k, 1M users
+#   python bench_users.py 10000 50000
+
+import os, sys, random, tempfile, tracemalloc
+
+os.environ.setdefault("VSR_STATE_DIR", tempfile.mkdtemp(prefix="vsr-bench-"))
+import run
+
+VIDEOS = {f"bench{i:06d}": {"first_seen": 0.0} for i in range(12)}  # 11-char ids like real ones
+MAX_BOOSTS = run.DEFAULT_POINTS // run.BOOST_COST
+
+def synthetic_boosts(n_users: int, seed: int = 7):
+    # (uid, [vid, ...]) with 1..10 boosts each (the daily point budget)
+    rnd = random.Random(seed)
+    vids = list(VIDEOS)
+    for _ in range(n_users):
+        uid = "%032x" % rnd.getrandbits(128)
+        yield uid, [rnd.choice(vids) for _ in range(rnd.randint(1, MAX_BOOSTS))]
+
+def build_dicts(n_users: int):
+    users, totals = {}, {}
+    for uid, vids in synthetic_boosts(n_users):
+        u = users[uid] = {"points": run.DEFAULT_POINTS, "boosts": {}}
+        for vid in vids:
+            u["points"] -= run.BOOST_COST
+            u["boosts"][vid] = u["boosts"].get(vid, 0) + 1
+            totals[vid] = totals.get(vid, 0) + 1
+    return users, totals
+
+def build_compact(n_users: int):
+    day = run.DailyState(0.0, VIDEOS)
+    for uid, vids in synthetic_boosts(n_users):
+        u = day.users[uid] = run.User()
+        for vid in vids:
+            slot = day.slot_of[vid]
+            u.boosts.append(slot)
+            day.totals[slot] += 1
+    return day
+
+def measure(build, n_users: int):
+    tracemalloc.start()
+    obj = build(n_users)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return size
+
+def main(sizes):
+    print(f"{'users':>9} {'dict-of-dicts':>13} {'B/user':>6} {'compact':>11} {'B/user':>6} {'ratio':>6}")
+    for n in sizes:
+        old = measure(build_dicts, n)
+        new = measure(build_compact, n)
+        print(f"{n:>9} {old / 2**20:>9.1f} MiB {old / n:>6.0f} {new / 2**20:>7.1f} MiB {new / n:>6.0f} {old / new:>5.1f}x")
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
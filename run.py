@@ -2,22 +2,271 @@
 # BASE: user's v459 (center notice EN) + v461 (news box in left blank area)
 # RULE: Do NOT touch other UI/layout. ONLY modify NEWS box section.
 
-from flask import Flask, render_template_string, request, redirect, make_response, jsonify
-import requests, re, time, uuid, hashlib
+from flask import Flask, Response, request, redirect, make_response, jsonify, abort
+from markupsafe import Markup
+import requests, re, time, uuid, hashlib, bisect, math, os, json, tempfile, threading, sqlite3, atexit
+from collections import Counter, deque
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+import calendar
 from urllib.parse import quote_plus
+from concurrent.futures import ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import xml.etree.ElementTree as ET
+import gzip, mmap, struct
+from array import array
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip/identity variants are served
+    brotli = None
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX dev box: single process, in-process locks are enough
+    fcntl = None
 
 
 app = Flask(__name__)
 HEADERS = {"User-Agent": "Mozilla/5.0"}
 COOKIE_NAME = "vsr_uid"
+DEFAULT_POINTS = 1000
+BOOST_COST = 100
+
+# -----------------------------
+# Host-local state (shared by all gunicorn workers on this box)
+# -----------------------------
+STATE_DIR = os.environ.get("VSR_STATE_DIR") or os.path.join(tempfile.gettempdir(), "viral-shorts-radar")
+os.makedirs(STATE_DIR, exist_ok=True)
+
+def read_json(path: str, default=None):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return default
+
+def write_json_atomic(path: str, obj):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(obj, f)
+    os.replace(tmp, path)
+
+class HostLock:
+    # try-lock held by at most one thread across every process on the host:
+    # a threading.Lock for this process plus flock() on a file in STATE_DIR
+    def __init__(self, name: str):
+        self.path = os.path.join(STATE_DIR, f"{name}.lock")
+        self.local = threading.Lock()
+        self.fd = None
+
+    def acquire(self, blocking: bool = False) -> bool:
+        if not self.local.acquire(blocking):
+            return False
+        if fcntl is None:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except OSError:
+            os.close(fd)
+            self.local.release()
+            return False
+        self.fd = fd
+        return True
+
+    def release(self):
+        if self.fd is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+            self.fd = None
+        self.local.release()
+
+# -----------------------------
+# Upstream HTTP client: one keep-alive session for every outbound fetch, so
+# repeated hits on news.google.com / www.youtube.com reuse their TLS sockets
+# -----------------------------
+UPSTREAM_POOL_HOSTS = int(os.environ.get("VSR_POOL_HOSTS", "8"))       # per-host pools kept
+UPSTREAM_POOL_MAXSIZE = int(os.environ.get("VSR_POOL_MAXSIZE", "8"))   # keep-alive sockets per host
+UPSTREAM_TIMEOUT = (3.05, 10)  # (connect, read) seconds unless the caller overrides
+UPSTREAM_RETRY = Retry(
+    total=2, connect=2, read=1, backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "HEAD"]),
+    raise_on_status=False,
+)
+
+def make_upstream_session():
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=UPSTREAM_POOL_HOSTS, pool_maxsize=UPSTREAM_POOL_MAXSIZE, max_retries=UPSTREAM_RETRY)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.headers.update(HEADERS)
+    return s
+
+UPSTREAM = make_upstream_session()
+
+def upstream_get(url: str, timeout=None, **kwargs):
+    return UPSTREAM.get(url, timeout=timeout or UPSTREAM_TIMEOUT, **kwargs)
+
+def upstream_stats():
+    # urllib3 counts requests and newly opened sockets per host pool;
+    # everything else went over a reused keep-alive connection
+    hosts = {}
+    for adapter in set(UPSTREAM.adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            h = hosts.setdefault(pool.host, {"requests": 0, "connections": 0, "reused": 0})
+            h["requests"] += pool.num_requests
+            h["connections"] += pool.num_connections
+            h["reused"] = max(h["requests"] - h["connections"], 0)
+    return hosts
+
+# -----------------------------
+# Upstream response cache: validators (ETag / Last-Modified) plus the parsed
+# payload, kept in memory and in a size-bounded on-disk LRU so a 304 can
+# reuse the last result across restarts without re-downloading or re-parsing
+# -----------------------------
+UPSTREAM_CACHE_MAX_BYTES = int(os.environ.get("VSR_UPSTREAM_CACHE_MB", "32")) * 1024 * 1024
+
+class DiskLRU:
+    # one file per key under `path`; recency is the file mtime (touched on
+    # every hit) and the least recently used files go once max_bytes is hit
+    def __init__(self, path: str, max_bytes: int):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.total = sum(st.st_size for _, st in self._entries())
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, hashlib.sha1(key.encode()).hexdigest())
+
+    def _entries(self):
+        for name in os.listdir(self.path):
+            if name.endswith(".tmp"):
+                continue
+            try:
+                yield name, os.stat(os.path.join(self.path, name))
+            except OSError:
+                pass
+
+    def get(self, key: str):
+        fn = self._file(key)
+        try:
+            with open(fn, "rb") as f:
+                data = f.read()
+            os.utime(fn)
+            return data
+        except OSError:
+            return None
+
+    def stat(self, key: str):
+        # -> os.stat_result of the entry (a hit, so it is touched too), or None
+        fn = self._file(key)
+        try:
+            os.utime(fn)
+            return os.stat(fn)
+        except OSError:
+            return None
+
+    def put(self, key: str, data: bytes):
+        fn = self._file(key)
+        tmp = f"{fn}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        with self.lock:
+            try:
+                self.total -= os.stat(fn).st_size
+            except OSError:
+                pass
+            os.replace(tmp, fn)
+            self.total += len(data)
+            if self.total > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        # other workers write here too, so rescan instead of trusting self.total
+        files = sorted((st.st_mtime, name, st.st_size) for name, st in self._entries())
+        self.total = sum(size for _, _, size in files)
+        for _, name, size in files:
+            if self.total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.path, name))
+                self.total -= size
+            except OSError:
+                pass
+
+UPSTREAM_CACHE = DiskLRU(os.path.join(STATE_DIR, "upstream"), UPSTREAM_CACHE_MAX_BYTES)
+UPSTREAM_MEMO = {}  # url -> cache entry, saves the disk read + JSON decode on 304s
+
+def upstream_cache_get(key: str):
+    entry = UPSTREAM_MEMO.get(key)
+    if entry is None:
+        raw = UPSTREAM_CACHE.get(key)
+        if raw:
+            try:
+                entry = json.loads(raw)
+                UPSTREAM_MEMO[key] = entry
+            except ValueError:
+                entry = None
+    return entry
+
+def conditional_fetch(url: str, parse, timeout=None, stream=False, key=None):
+    # GET with If-None-Match / If-Modified-Since from the last response;
+    # returns (payload, not_modified). parse(response) builds the payload on 200.
+    key = key or url
+    entry = upstream_cache_get(key)
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    r = upstream_get(url, timeout=timeout, headers=headers, stream=stream)
+    if r.status_code == 304 and entry:
+        r.close()
+        try:
+            os.utime(UPSTREAM_CACHE._file(key))
+        except OSError:
+            pass
+        return entry["payload"], True
+    try:
+        r.raise_for_status()
+        payload = parse(r)
+    finally:
+        r.close()
+    etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+    if etag or last_modified:
+        entry = {"url": url, "etag": etag, "last_modified": last_modified, "stored": time.time(), "payload": payload}
+        UPSTREAM_MEMO[key] = entry
+        try:
+            UPSTREAM_CACHE.put(key, json.dumps(entry).encode("utf-8"))
+        except OSError:
+            pass
+    return payload, False
 
 # -----------------------------
 # News cache (server memory)
 # -----------------------------
-NEWS_CACHE = {"ts": 0.0, "items": []}
+NEWS_CACHE = {"version": 0, "ts": 0.0, "items": [], "feeds": [], "fails": 0, "retry_at": 0.0}
+NEWS_SNAPSHOT_KEYS = ("version", "ts", "items", "feeds", "fails", "retry_at")
 NEWS_TTL_SEC = 180  # 3 min server fetch cache; client can refresh UI every 60s
+NEWS_MAX_STALE_SEC = 3600  # past this, stale items are no longer served
+NEWS_BACKOFF_SEC = 30      # first retry delay after a failed refresh, doubled per failure
+NEWS_BACKOFF_MAX_SEC = 600
+NEWS_SNAPSHOT_PATH = os.path.join(STATE_DIR, "news.json")
+NEWS_REFRESH_LOCK = HostLock("news-refresh")
+NEWS_FETCH_TIMEOUT_SEC = 8   # per feed (connect/read)
+NEWS_FETCH_BUDGET_SEC = 6.0  # wall clock for the whole refresh; late feeds are skipped
+NEWS_FETCH_WORKERS = 8
 
 # Google News RSS feeds (English)
 NEWS_FEEDS = [
@@ -40,63 +289,127 @@ def normalize_title_key(title: str) -> str:
     toks = [w for w in t.split() if w]
     return " ".join(toks[:9])
 
-def parse_rfc822_to_ts(dt_str: str) -> float:
+RFC822_MONTHS = {m: i for i, m in enumerate(
+    ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], start=1)}
+
+@lru_cache(maxsize=4096)
+def _rfc822_ts(dt_str: str):
+    # fast path for "Tue, 14 Oct 2025 08:00:00 GMT" / "+0000"; feeds repeat the
+    # same strings across refreshes, hence the memo. None = unparseable.
+    p = dt_str.split()
+    if p and p[0].endswith(","):
+        p = p[1:]
+    try:
+        day, mon, year, hms = int(p[0]), RFC822_MONTHS[p[1][:3].title()], int(p[2]), p[3].split(":")
+        zone = p[4] if len(p) > 4 else "GMT"
+        if zone in ("GMT", "UTC", "UT", "Z"):
+            offset = 0
+        elif zone[0] in "+-" and len(zone) == 5:
+            offset = (int(zone[1:3]) * 3600 + int(zone[3:5]) * 60) * (1 if zone[0] == "+" else -1)
+        else:
+            raise ValueError(zone)
+        sec = int(hms[2]) if len(hms) > 2 else 0
+        return float(calendar.timegm((year, mon, day, int(hms[0]), int(hms[1]), sec))) - offset
+    except (IndexError, KeyError, ValueError):
+        pass
     try:
-        from email.utils import parsedate_to_datetime
         d = parsedate_to_datetime(dt_str)
         if d.tzinfo is None:
             d = d.replace(tzinfo=timezone.utc)
         return d.timestamp()
     except Exception:
-        return time.time()
-
-def fetch_rss_items(url: str, timeout=8):
-    try:
-        r = requests.get(url, headers=HEADERS, timeout=timeout)
-        r.raise_for_status()
-        xml = r.text
-    except Exception:
-        return []
+        return None
 
-    items = []
-    try:
-        root = ET.fromstring(xml)
-        channel = root.find("channel")
-        if channel is None:
-            return []
-
-        for it in channel.findall("item"):
-            title = safe_text(it.findtext("title"))
-            link = safe_text(it.findtext("link"))
-            pub = safe_text(it.findtext("pubDate"))
-
-            publisher = ""
-            if " - " in title:
-                parts = title.rsplit(" - ", 1)
-                if len(parts) == 2:
-                    title_clean = parts[0].strip()
-                    publisher = parts[1].strip()
-                else:
-                    title_clean = title
-            else:
-                title_clean = title
-
-            items.append({
-                "title": title_clean or title,
-                "publisher": publisher,
-                "link": link,
-                "pub_ts": parse_rfc822_to_ts(pub) if pub else time.time(),
-            })
-    except Exception:
-        return []
+def parse_rfc822_to_ts(dt_str: str) -> float:
+    ts = _rfc822_ts(dt_str)
+    return time.time() if ts is None else ts
+
+def rss_item(it):
+    title = safe_text(it.findtext("title"))
+    link = safe_text(it.findtext("link"))
+    pub = safe_text(it.findtext("pubDate"))
+
+    publisher = ""
+    if " - " in title:
+        parts = title.rsplit(" - ", 1)
+        if len(parts) == 2:
+            title_clean = parts[0].strip()
+            publisher = parts[1].strip()
+        else:
+            title_clean = title
+    else:
+        title_clean = title
+
+    return {
+        "title": title_clean or title,
+        "publisher": publisher,
+        "link": link,
+        "pub_ts": parse_rfc822_to_ts(pub) if pub else time.time(),
+    }
 
+def parse_rss_stream(chunks):
+    # incremental parse of rss/channel/item: each <item> is converted as soon
+    # as it closes and then dropped from the tree, so memory stays flat
+    parser = ET.XMLPullParser(events=("start", "end"))
+    path, channel, items = [], None, []
+    for chunk in chunks:
+        parser.feed(chunk)
+        for ev, el in parser.read_events():
+            if ev == "start":
+                path.append(el.tag)
+                if len(path) == 2 and el.tag == "channel" and channel is None:
+                    channel = el
+                continue
+            path.pop()
+            if el.tag == "item" and len(path) == 2 and path[1] == "channel" and channel is not None:
+                items.append(rss_item(el))
+                channel.clear()
+    parser.close()
     return items
 
-def build_ranked_news(limit=7):
-    raw = []
-    for feed in NEWS_FEEDS:
-        raw.extend(fetch_rss_items(feed))
+def parse_rss_items(xml: str):
+    return parse_rss_stream([xml])
+
+def fetch_feed(url: str, timeout=NEWS_FETCH_TIMEOUT_SEC):
+    # returns (items, status) so a refresh can report per-feed outcomes
+    t0 = time.time()
+    st = {"url": url, "status": "ok", "items": 0, "ms": 0, "not_modified": False}
+    try:
+        items, st["not_modified"] = conditional_fetch(
+            url, lambda r: parse_rss_stream(r.iter_content(16384)), timeout=timeout, stream=True)
+    except Exception as e:
+        items = []
+        st["status"] = "error"
+        st["error"] = type(e).__name__
+    st["items"] = len(items)
+    st["ms"] = int((time.time() - t0) * 1000)
+    return items, st
+
+def fetch_rss_items(url: str, timeout=NEWS_FETCH_TIMEOUT_SEC):
+    return fetch_feed(url, timeout=timeout)[0]
+
+# bounded pool shared by all refreshes; never used as a context manager so a
+# slow feed can't hold the caller past NEWS_FETCH_BUDGET_SEC
+NEWS_POOL = ThreadPoolExecutor(max_workers=NEWS_FETCH_WORKERS, thread_name_prefix="news")
+NEWS_FEED_STATUS = []  # per-feed status of the last refresh
+
+def fetch_all_feeds(feeds=None, budget=NEWS_FETCH_BUDGET_SEC):
+    feeds = NEWS_FEEDS if feeds is None else feeds
+    futs = {NEWS_POOL.submit(fetch_feed, url): url for url in feeds}
+    wait(futs, timeout=budget)
+
+    raw, statuses = [], []
+    for fut, url in futs.items():
+        if fut.done():
+            items, st = fut.result()
+            raw.extend(items)
+        else:
+            fut.cancel()
+            st = {"url": url, "status": "timeout", "items": 0, "ms": int(budget * 1000)}
+        statuses.append(st)
+    return raw, statuses
 
+def rank_news(raw, limit=7):
     if not raw:
         return []
 
@@ -145,66 +458,210 @@ def build_ranked_news(limit=7):
     ranked.sort(key=lambda x: x["score"], reverse=True)
     return ranked[:limit]
 
+def build_ranked_news(limit=7):
+    global NEWS_FEED_STATUS
+    raw, NEWS_FEED_STATUS = fetch_all_feeds()
+    return rank_news(raw, limit=limit)
+
+# -----------------------------
+# Stale-while-revalidate: serve the last good items after the TTL while one
+# background refresh (per host, via NEWS_REFRESH_LOCK) rebuilds them. The
+# result is published to NEWS_SNAPSHOT_PATH so the other workers pick it up.
+# -----------------------------
+def load_news_snapshot():
+    try:
+        mtime = os.stat(NEWS_SNAPSHOT_PATH).st_mtime
+    except OSError:
+        return
+    if mtime == NEWS_CACHE.get("snap_mtime"):
+        return
+    snap = read_json(NEWS_SNAPSHOT_PATH)
+    if not snap:
+        return
+    NEWS_CACHE["snap_mtime"] = mtime
+    if snap["ts"] > NEWS_CACHE["ts"] or snap["retry_at"] > NEWS_CACHE["retry_at"]:
+        NEWS_CACHE.update({k: snap.get(k, 0) for k in NEWS_SNAPSHOT_KEYS})
+        remember_news()
+
+def refresh_news():
+    # runs with NEWS_REFRESH_LOCK held; a failed build keeps the old items
+    try:
+        try:
+            items = build_ranked_news(limit=7)
+        except Exception:
+            items = []
+        load_news_snapshot()  # continue the version sequence from the other workers
+        now = time.time()
+        if items:
+            NEWS_CACHE.update({"version": NEWS_CACHE["version"] + 1, "ts": now, "items": items,
+                               "feeds": NEWS_FEED_STATUS, "fails": 0, "retry_at": 0.0})
+            remember_news()
+        else:
+            fails = NEWS_CACHE["fails"] + 1
+            delay = min(NEWS_BACKOFF_SEC * 2 ** (fails - 1), NEWS_BACKOFF_MAX_SEC)
+            NEWS_CACHE.update({"feeds": NEWS_FEED_STATUS, "fails": fails, "retry_at": now + delay})
+        try:
+            write_json_atomic(NEWS_SNAPSHOT_PATH, {k: NEWS_CACHE[k] for k in NEWS_SNAPSHOT_KEYS})
+        except OSError:
+            pass
+    finally:
+        NEWS_REFRESH_LOCK.release()
+
+def start_news_refresh() -> bool:
+    if time.time() < NEWS_CACHE["retry_at"]:
+        return False
+    if not NEWS_REFRESH_LOCK.acquire(blocking=False):
+        return False
+    threading.Thread(target=refresh_news, name="news-refresh", daemon=True).start()
+    return True
+
+def news_is_fresh(max_age=None) -> bool:
+    max_age = NEWS_TTL_SEC if max_age is None else max_age
+    return bool(NEWS_CACHE["items"]) and time.time() - NEWS_CACHE["ts"] < max_age
+
 def get_ranked_news_cached():
-    if time.time() - NEWS_CACHE["ts"] < NEWS_TTL_SEC and NEWS_CACHE["items"]:
+    if news_is_fresh():
         return NEWS_CACHE["items"]
-    items = build_ranked_news(limit=7)
-    NEWS_CACHE["ts"] = time.time()
-    NEWS_CACHE["items"] = items
-    return items
 
-@app.get("/api/news")
-def api_news():
-    items = get_ranked_news_cached()
-    return jsonify({"ok": True, "items": items})
+    load_news_snapshot()  # another worker may have refreshed already
+    if news_is_fresh():
+        return NEWS_CACHE["items"]
 
-@app.get("/api/pump_pack")
-def api_pump_pack():
-    vid = request.args.get("vid", "").strip()
-    if not vid:
-        return jsonify({"ok": False, "error": "missing vid"}), 400
+    start_news_refresh()
+    if news_is_fresh(NEWS_MAX_STALE_SEC):
+        return NEWS_CACHE["items"]
 
-    url = f"https://www.youtube.com/shorts/{vid}"
-    thumb = f"https://i.ytimg.com/vi/{vid}/hqdefault.jpg"
+    # cold start or too stale to serve: wait (bounded) for whoever is refreshing
+    deadline = time.time() + NEWS_FETCH_BUDGET_SEC + 1
+    while time.time() < deadline:
+        time.sleep(0.1)
+        load_news_snapshot()
+        if news_is_fresh(NEWS_MAX_STALE_SEC) or time.time() < NEWS_CACHE["retry_at"]:
+            break
+    return NEWS_CACHE["items"] if news_is_fresh(NEWS_MAX_STALE_SEC) else []
 
-    seed = int(hashlib.sha256(vid.encode()).hexdigest()[:8], 16)
-    adjs = ["Viral", "Neon", "Turbo", "Prime", "Hyper"]
-    nouns = ["Capsule", "Coin", "Wave", "Clip", "Buzz"]
-    name = f"{adjs[seed % len(adjs)]}{nouns[(seed // 3) % len(nouns)]}"
-    ticker = hashlib.md5(vid.encode()).hexdigest().upper()[:4]
+# -----------------------------
+# /api/news versions: every published snapshot gets the next version number
+# (carried in the snapshot file, so all workers agree). A client sends back
+# the version it holds (?since= or If-None-Match) and gets a 304, or a diff
+# against that version while it is still in NEWS_HISTORY, else the full
+# list. Bodies are serialized and gzipped once per (version, since).
+# -----------------------------
+NEWS_HISTORY = deque(maxlen=8)  # (version, items) of recent snapshots
+NEWS_BODIES = {}  # (version, retry_at, since) -> {"identity", "gzip"}
+NEWS_BODIES_MAX = 64
+
+def remember_news():
+    if NEWS_CACHE["items"] and (not NEWS_HISTORY or NEWS_HISTORY[-1][0] != NEWS_CACHE["version"]):
+        NEWS_HISTORY.append((NEWS_CACHE["version"], NEWS_CACHE["items"]))
+
+def news_diff(since: int):
+    # -> added (new or changed, with "rank"), removed (q keys) and reranked
+    # ({q: rank}) relative to `since`, or None when that version is gone
+    old = next((items for v, items in NEWS_HISTORY if v == since), None)
+    if old is None:
+        return None
+    def shown(n):
+        return n["title"], n["sources"], n["mentions"]
+    before = {n["q"]: (rank, shown(n)) for rank, n in enumerate(old, start=1)}
+    added, reranked = [], {}
+    for rank, n in enumerate(NEWS_CACHE["items"], start=1):
+        prev = before.pop(n["q"], None)
+        if prev is None or prev[1] != shown(n):
+            added.append(dict(n, rank=rank))
+        elif prev[0] != rank:
+            reranked[n["q"]] = rank
+    return {"ok": True, "version": NEWS_CACHE["version"], "since": since,
+            "added": added, "removed": list(before), "reranked": reranked}
+
+def news_body(since=None):
+    key = (NEWS_CACHE["version"], NEWS_CACHE["retry_at"], since)
+    body = NEWS_BODIES.get(key)
+    if body is None:
+        payload = news_diff(since) if since is not None else None
+        if payload is None:
+            payload = {"ok": True, "version": NEWS_CACHE["version"], "items": NEWS_CACHE["items"],
+                       "ts": NEWS_CACHE["ts"], "feeds": NEWS_CACHE["feeds"]}
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        body = {"identity": raw, "gzip": gzip.compress(raw, 6)}
+        if len(NEWS_BODIES) >= NEWS_BODIES_MAX:
+            NEWS_BODIES.clear()
+        NEWS_BODIES[key] = body
+    return body
+
+NEWS_ETAG_RE = re.compile(r'news-(\d+)')
+
+def news_since():
+    # the version the client already has: ?since=, else the newest news-<v>
+    # it revalidates with, so a plain conditional GET also gets a diff
+    since = request.args.get("since", type=int)
+    if since is None:
+        seen = [int(v) for v in NEWS_ETAG_RE.findall(request.headers.get("If-None-Match", ""))]
+        since = max(seen) if seen else None
+    return since
 
-    desc = (
-        f"{name} (${ticker}) — minted from today’s viral short.\n"
-        f"Source: {url}\n"
-        f"No roadmap. Just vibes."
-    )
+@app.get("/api/news")
+def api_news():
+    items = get_ranked_news_cached()
+    version = NEWS_CACHE["version"]
+    if not items:
+        return jsonify({"ok": True, "version": version, "items": [], "ts": NEWS_CACHE["ts"], "feeds": NEWS_CACHE["feeds"]})
+
+    tag = f"news-{version}"  # weak: feed diagnostics may change under one version
+    since = news_since()
+    if since == version or request.if_none_match.contains_weak(tag):
+        resp = make_response("", 304)
+    else:
+        body = news_body(since)
+        encoding = "gzip" if request.accept_encodings["gzip"] else "identity"
+        resp = make_response(body[encoding])
+        resp.headers["Content-Type"] = "application/json"
+        if encoding != "identity":
+            resp.headers["Content-Encoding"] = encoding
+    resp.set_etag(tag, weak=True)
+    resp.headers["Vary"] = "Accept-Encoding, If-None-Match"  # a diff or the full list
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
 
-    return jsonify({
-        "ok": True,
-        "vid": vid,
-        "name": name,
-        "ticker": ticker,
-        "description": desc,
-        "source_url": url,
-        "thumb": thumb
-    })
+@app.get("/api/upstream")
+def api_upstream():
+    return jsonify({"ok": True, "hosts": upstream_stats()})
 
 # -----------------------------
 # Shorts collection
 # -----------------------------
-def extract_ids(html: str):
-    return re.findall(r"/shorts/([a-zA-Z0-9_-]{11})", html)
+SHORTS_ID_RE = re.compile(rb"/shorts/([a-zA-Z0-9_-]{11})")
+SHORTS_ID_CARRY = len(b"/shorts/") + 11 - 1  # bytes kept so a match can span two chunks
+
+def scan_shorts_ids(chunks, limit: int):
+    # -> (ids in first-seen order, reached_eof); stops reading at `limit` unique ids
+    ids = {}  # ordered set
+    tail = b""
+    for chunk in chunks:
+        buf = tail + chunk
+        for m in SHORTS_ID_RE.finditer(buf):
+            ids[m.group(1).decode("ascii")] = None
+            if len(ids) >= limit:
+                return list(ids), False
+        tail = buf[-SHORTS_ID_CARRY:]
+    return list(ids), True
 
-def fetch_html(url: str):
+def fetch_shorts_ids(url: str, limit: int):
+    # the response is closed as soon as `limit` ids are found; the cache key
+    # carries the limit since a truncated scan can't answer a bigger one
     try:
-        r = requests.get(url, headers=HEADERS, timeout=10)
-        r.raise_for_status()
-        return r.text
+        payload, _ = conditional_fetch(
+            url,
+            lambda r: scan_shorts_ids(r.iter_content(65536), limit)[0],
+            stream=True,
+            key=f"{url}#shorts={limit}",
+        )
+        return payload
     except Exception:
-        return ""
+        return []
 
 def build_daily_videos(limit: int = 12):
-    ids = []
+    ids = {}  # ordered set
     sources = [
         "https://www.youtube.com/shorts",
         "https://www.youtube.com/results?search_query=viral+shorts",
@@ -212,12 +669,8 @@ def build_daily_videos(limit: int = 12):
         "https://www.youtube.com/results?search_query=meme+shorts",
     ]
     for url in sources:
-        html = fetch_html(url)
-        if not html:
-            continue
-        for vid in extract_ids(html):
-            if vid not in ids:
-                ids.append(vid)
+        for vid in fetch_shorts_ids(url, limit):
+            ids[vid] = None
             if len(ids) >= limit:
                 break
         if len(ids) >= limit:
@@ -225,7 +678,7 @@ def build_daily_videos(limit: int = 12):
 
     now = time.time()
     videos = {}
-    for vid in ids[:limit]:
+    for vid in list(ids)[:limit]:
         videos[vid] = {
             "id": vid,
             "url": f"https://www.youtube.com/shorts/{vid}",
@@ -234,6 +687,86 @@ def build_daily_videos(limit: int = 12):
         }
     return videos
 
+# -----------------------------
+# Thumbnails: /thumb/<vid> fetches each image from i.ytimg.com once into a
+# size-bounded disk LRU (shared by the workers on a host) and serves it
+# same-origin with long cache lifetimes. size=mq is YouTube's own 320x180
+# rendition, used by the grid; hq (480x360) is the default.
+# -----------------------------
+THUMB_CACHE_MAX_BYTES = int(os.environ.get("VSR_THUMB_CACHE_MB", "64")) * 1024 * 1024
+THUMB_CACHE = DiskLRU(os.path.join(STATE_DIR, "thumbs"), THUMB_CACHE_MAX_BYTES)
+THUMB_SIZES = {"hq": "hqdefault.jpg", "mq": "mqdefault.jpg"}
+THUMB_FETCH_TIMEOUT = (3.05, 5)
+THUMB_MISS_SEC = 300  # a failed fetch is not retried sooner than this
+THUMB_MISSES = {}     # "vid/size" -> retry after
+THUMB_LOCKS = [threading.Lock() for _ in range(16)]  # one upstream fetch per key at a time
+VID_RE = re.compile(r"[a-zA-Z0-9_-]{11}")
+
+def thumb_url(vid: str, size: str = "hq") -> str:
+    return f"/thumb/{vid}" if size == "hq" else f"/thumb/{vid}?size={size}"
+
+def get_thumb(vid: str, size: str = "hq"):
+    key = f"{vid}/{size}"
+    data = THUMB_CACHE.get(key)
+    if data is not None or time.time() < THUMB_MISSES.get(key, 0):
+        return data
+    with THUMB_LOCKS[hash(key) % len(THUMB_LOCKS)]:
+        data = THUMB_CACHE.get(key)  # fetched while we waited
+        if data is not None:
+            return data
+        try:
+            r = upstream_get(f"https://i.ytimg.com/vi/{vid}/{THUMB_SIZES[size]}", timeout=THUMB_FETCH_TIMEOUT)
+            if r.status_code == 200 and r.headers.get("Content-Type", "").startswith("image/"):
+                data = r.content
+        except requests.RequestException:
+            pass
+        if not data:
+            THUMB_MISSES[key] = time.time() + THUMB_MISS_SEC
+            return None
+        THUMB_MISSES.pop(key, None)
+        try:
+            THUMB_CACHE.put(key, data)
+        except OSError:
+            pass
+        return data
+
+def prewarm_thumbs(videos: dict):
+    def run():
+        for vid in videos:
+            for size in THUMB_SIZES:
+                get_thumb(vid, size)
+    threading.Thread(target=run, name="thumb-prewarm", daemon=True).start()
+
+@app.get("/thumb/<vid>")
+def thumb(vid):
+    size = request.args.get("size", "hq")
+    if size not in THUMB_SIZES or not VID_RE.fullmatch(vid):
+        return "not found", 404
+    key = f"{vid}/{size}"
+    st, data = THUMB_CACHE.stat(key), None
+    # only today's (and tomorrow's prebuilt) videos reach upstream
+    if st is None and (vid in DAY.videos or vid in (NEXT_DAY["videos"] or {})):
+        data = get_thumb(vid, size)
+        st = THUMB_CACHE.stat(key)
+    if st is None and data is None:
+        return "not found", 404
+
+    # every put replaces the file (new inode), so inode + size name the bytes
+    # without reading or hashing them; a revalidation costs one stat
+    etag = f"{st.st_ino:x}-{st.st_size:x}" if st is not None else hashlib.sha1(data).hexdigest()
+    if request.if_none_match.contains(etag):
+        resp = make_response("", 304)
+    else:
+        if data is None:
+            data = THUMB_CACHE.get(key)
+            if data is None:  # evicted since the stat
+                return "not found", 404
+        resp = make_response(data)
+        resp.headers["Content-Type"] = "image/jpeg"
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = "public, max-age=604800"
+    return resp
+
 # -----------------------------
 # Daily reset at UTC 00:00
 # -----------------------------
@@ -241,39 +774,674 @@ def utc_midnight_ts():
     now = datetime.now(timezone.utc)
     return datetime(now.year, now.month, now.day, tzinfo=timezone.utc).timestamp()
 
-DAY_START_TS = utc_midnight_ts()
-VIDEOS = build_daily_videos(limit=12)
-USERS = {}
+# -----------------------------
+# Video set snapshots (one file per UTC day): workers boot from the persisted
+# set and discover live in the background instead of at import time
+# -----------------------------
+VIDEOS_BUILD_LOCK = HostLock("videos-build")
+VIDEOS_POOL_SIZE = int(os.environ.get("VSR_FEED_POOL", "120"))  # candidates collected per day
+VIDEOS_RETRY_SEC = 60
+VIDEOS_KEEP_DAYS = 3
+
+def videos_snapshot_path(day_start_ts: float) -> str:
+    day = datetime.fromtimestamp(day_start_ts, timezone.utc).strftime("%Y%m%d")
+    return os.path.join(STATE_DIR, f"videos-{day}.json")
+
+def load_videos_snapshot(day_start_ts: float):
+    snap = read_json(videos_snapshot_path(day_start_ts))
+    if snap and snap.get("day") == day_start_ts and snap.get("videos"):
+        return snap["videos"]
+    return None
+
+def save_videos_snapshot(day_start_ts: float, videos: dict):
+    try:
+        write_json_atomic(videos_snapshot_path(day_start_ts), {"day": day_start_ts, "videos": videos})
+        keep = {videos_snapshot_path(day_start_ts - 86400 * i) for i in range(-1, VIDEOS_KEEP_DAYS)}
+        for name in os.listdir(STATE_DIR):
+            path = os.path.join(STATE_DIR, name)
+            if name.startswith("videos-") and name.endswith(".json") and path not in keep:
+                os.remove(path)
+    except OSError:
+        pass
+
+def build_or_load_videos(day_start_ts: float):
+    # one worker per host hits YouTube; the others wait on the lock and then
+    # pick up the snapshot it wrote
+    VIDEOS_BUILD_LOCK.acquire(blocking=True)
+    try:
+        videos = load_videos_snapshot(day_start_ts)
+        if videos is None:
+            videos = build_daily_videos(limit=VIDEOS_POOL_SIZE)
+            if videos:
+                save_videos_snapshot(day_start_ts, videos)
+                prewarm_thumbs(videos)
+        return videos
+    finally:
+        VIDEOS_BUILD_LOCK.release()
 
 # -----------------------------
-# Visitors (server-memory)
+# Visitors
 # - Total: never reset
-# - Today: reset at UTC 00:00
+# - Today: reset at UTC 00:00 (lives on DailyState)
+# VSR_VISITOR_COUNT=hll (default) counts distinct uids with HyperLogLog
+# sketches: 2^HLL_P one-byte registers (16 KiB) per sketch however many
+# uids arrive. Standard error is 1.04/sqrt(2^HLL_P) ~ 0.8% (about 2.5% at
+# three sigma); below ~40k visitors linear counting is used and is close to
+# exact. Sketches merge by register-wise max, so workers and days combine
+# without double counting, and the registers are the on-disk format.
+# VSR_VISITOR_COUNT=exact keeps every uid (set in memory + a row per uid).
+# -----------------------------
+VISITOR_COUNT_MODE = os.environ.get("VSR_VISITOR_COUNT", "hll")
+HLL_P = 14
+HLL_M = 1 << HLL_P
+HLL_ALPHA = 0.7213 / (1 + 1.079 / HLL_M)
+
+def hll_point(uid: str):
+    # -> (register index, rank of the first 1 bit in the remaining 50 bits)
+    h = int.from_bytes(hashlib.blake2b(uid.encode(), digest_size=8).digest(), "big")
+    rest = h & ((1 << (64 - HLL_P)) - 1)
+    return h >> (64 - HLL_P), (64 - HLL_P) - rest.bit_length() + 1
+
+def hll_merge(a: bytes, b: bytes) -> bytes:
+    return bytes(map(max, a, b))
+
+def hll_estimate(registers) -> int:
+    hist = Counter(registers)
+    est = HLL_ALPHA * HLL_M * HLL_M / sum(n * 2.0 ** -r for r, n in hist.items())
+    zeros = hist.get(0, 0)
+    if est <= 2.5 * HLL_M and zeros:
+        est = HLL_M * math.log(HLL_M / zeros)  # linear counting while sparse
+    return int(round(est))
+
+class HyperLogLog:
+    def __init__(self, registers=None):
+        self.registers = bytearray(HLL_M) if registers is None else registers
+        self.lock = threading.Lock()
+        self._count = None
+
+    def add(self, uid: str) -> bool:
+        # registers only grow; most adds are one compare and no lock
+        idx, rank = hll_point(uid)
+        if self.registers[idx] >= rank:
+            return False
+        with self.lock:
+            if self.registers[idx] >= rank:
+                return False
+            self.registers[idx] = rank
+            self._count = None
+        return True
+
+    def merge(self, other: "HyperLogLog"):
+        with self.lock:
+            self.registers[:] = hll_merge(self.registers, other.registers)
+            self._count = None
+
+    def count(self) -> int:
+        if self._count is None:
+            self._count = hll_estimate(self.registers)
+        return self._count
+
+VISITOR_UIDS_TOTAL = set()  # exact mode; counts are len() of the sets, so set.add is the only write
+VISITOR_SKETCH_TOTAL = HyperLogLog()  # hll mode
+
+# -----------------------------
+# Scoring / ranking
+# -----------------------------
+class Leaderboard:
+    # Ranked order kept as a sorted list of keys, so a boost only moves one
+    # entry instead of re-sorting the whole feed on every page view.
+    # Time decay is monotonic in age and one boost (+50) outweighs the whole
+    # decay range (<40), so (-boosts, -first_seen) orders exactly like
+    # viral_score() and the decayed score itself is computed lazily on read.
+    # Writers copy the list and swap it in under the lock, so readers never
+    # see an entry mid-move; boosts only grow, so a late stale write is ignored.
+    def __init__(self, videos=None):
+        self.lock = threading.Lock()
+        self.reset(videos or {})
+
+    def reset(self, videos):
+        self.version = getattr(self, "version", 0) + 1
+        self.key_of = {}
+        for seq, (vid, meta) in enumerate(videos.items()):
+            self.key_of[vid] = (0, -meta["first_seen"], seq, vid)
+        self.keys = sorted(self.key_of.values())
+
+    def set_boosts(self, vid: str, boosts: int):
+        with self.lock:
+            old = self.key_of.get(vid)
+            if old is None or -old[0] >= boosts:
+                return
+            keys = self.keys[:]
+            del keys[bisect.bisect_left(keys, old)]
+            new = (-boosts,) + old[1:]
+            bisect.insort(keys, new)
+            self.keys = keys
+            self.key_of[vid] = new
+            self.version += 1
+
+    def rank(self, vid: str):
+        key = self.key_of.get(vid)
+        if key is None:
+            return None
+        return bisect.bisect_left(self.keys, key) + 1
+
+    def winner(self):
+        return self.keys[0][3] if self.keys else None
+
+    def top(self, n=None):
+        keys = self.keys if n is None else self.keys[:n]
+        return [k[3] for k in keys]
+
+    def page(self, after=None, n=12):
+        # -> [(rank, vid)] for the n entries ranked after key `after`
+        keys = self.keys
+        start = 0 if after is None else bisect.bisect_right(keys, after)
+        return [(start + i, k[3]) for i, k in enumerate(keys[start:start + n], start=1)]
+
+    def __len__(self):
+        return len(self.keys)
+
+class User:
+    # one per booster per day: the video slot of every boost spent, so points
+    # and per-video counts are derived rather than stored
+    __slots__ = ("boosts",)
+
+    def __init__(self):
+        self.boosts = array("H")
+
+    @property
+    def points(self) -> int:
+        return DEFAULT_POINTS - BOOST_COST * len(self.boosts)
+
+    def boost_counts(self, day: "DailyState") -> dict:
+        counts = {}
+        for slot in self.boosts:
+            vid = day.slot_vids[slot]
+            counts[vid] = counts.get(vid, 0) + 1
+        return counts
+
+class DailyState:
+    # everything that resets at 00:00 UTC; the reset swaps the whole object
+    # (one assignment to DAY), so a request never sees a half-reset day
+    def __init__(self, start_ts: float, videos: dict):
+        self.start_ts = start_ts
+        self.videos = videos
+        self.users = {}  # uid -> User, boosters only; this worker's index, the SQLite ledger holds points
+        self.slot_of = {}         # vid -> small int for the day, append-only
+        self.slot_vids = []       # slot -> vid
+        self.totals = array("q")  # slot -> boosts today (index over users' boosts)
+        for vid in videos:
+            self.slot(vid)
+        self.leaderboard = Leaderboard(videos)
+        self.visitor_uids = set()  # exact mode
+        self.visitor_sketch = HyperLogLog()  # hll mode
+        self.counters = None  # SharedCounters once the video set is known
+        self.synced_gen = -1
+
+    @property
+    def warming(self) -> bool:
+        return not self.videos
+
+    def slot(self, vid: str) -> int:
+        slot = self.slot_of.get(vid)
+        if slot is None:
+            slot = self.slot_of[vid] = len(self.slot_vids)
+            self.slot_vids.append(vid)
+            self.totals.append(0)
+        return slot
+
+    def boost_totals(self) -> dict:
+        # vid -> boosts today, videos without any left out
+        return {self.slot_vids[slot]: n for slot, n in enumerate(self.totals) if n}
+
+    def install_videos(self, videos: dict):
+        # warm-up finished for a day that started empty
+        for vid in videos:
+            self.slot(vid)
+        lb = Leaderboard(videos)
+        for vid, n in self.boost_totals().items():
+            lb.set_boosts(vid, n)
+        self.videos = videos
+        self.leaderboard = lb
+        attach_counters(self)
+
+    def sync_shared(self):
+        # pull boosts made by other workers into the leaderboard; one mmap
+        # read when nothing changed
+        c = self.counters
+        if c is None:
+            return
+        gen = c.generation()
+        if gen == self.synced_gen:
+            return
+        for vid in self.videos:
+            self.leaderboard.set_boosts(vid, c.get(vid))
+        self.synced_gen = gen
+
+    def retire(self):
+        # after the flip: unmap the day's counters (readers fall back to local totals)
+        c, self.counters = self.counters, None
+        if c is not None:
+            c.close()
+
+# -----------------------------
+# Durable state (SQLite, WAL). The users/boosts rows are the points ledger
+# every worker spends from: a boost is a guarded debit written through in
+# its own transaction, so one uid cannot spend its points once per worker.
+# Visits are queued in memory and written behind in one batched transaction
+# every DB_FLUSH_SEC. A restart reloads the day from here.
+# -----------------------------
+DB_PATH = os.environ.get("VSR_DB") or os.path.join(STATE_DIR, "radar.sqlite3")
+DB_FLUSH_SEC = 2.0
+DB_EVENTS = deque()  # ("visit", day, uid)
+DB_LOCAL = threading.local()  # per-thread connection for request-path writes
+DB_SKETCHES = {}     # day (0 = all time) -> HyperLogLog changed since the last flush
+
+DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (day INTEGER, uid TEXT, points INTEGER, PRIMARY KEY (day, uid));
+CREATE TABLE IF NOT EXISTS boosts (day INTEGER, uid TEXT, vid TEXT, n INTEGER, PRIMARY KEY (day, uid, vid));
+CREATE TABLE IF NOT EXISTS visitors (uid TEXT PRIMARY KEY, first_day INTEGER);
+CREATE TABLE IF NOT EXISTS visitors_day (day INTEGER, uid TEXT, PRIMARY KEY (day, uid));
+CREATE TABLE IF NOT EXISTS visitor_sketches (day INTEGER PRIMARY KEY, registers BLOB);
+"""
+
+def db_connect():
+    conn = sqlite3.connect(DB_PATH, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")  # WAL: fsync on checkpoint, not per commit
+    conn.create_function("hll_merge", 2, hll_merge, deterministic=True)
+    return conn
+
+def db_thread_conn():
+    conn = getattr(DB_LOCAL, "conn", None)
+    if conn is None:
+        conn = DB_LOCAL.conn = db_connect()
+    return conn
+
+def db_init():
+    conn = db_connect()
+    try:
+        conn.executescript(DB_SCHEMA)
+    finally:
+        conn.close()
+
+def db_flush() -> int:
+    events = []
+    while DB_EVENTS:
+        events.append(DB_EVENTS.popleft())
+    sketches = []
+    while DB_SKETCHES:
+        sketches.append(DB_SKETCHES.popitem())
+    if not events and not sketches:
+        return 0
+
+    visits = {ev[1:] for ev in events}
+
+    conn = db_connect()
+    try:
+        with conn:
+            # row by row so rowcount tells which uids are new across all workers
+            new_total, new_today = 0, Counter()
+            for day, uid in visits:
+                new_total += conn.execute("INSERT OR IGNORE INTO visitors (uid, first_day) VALUES (?, ?)", (uid, day)).rowcount
+                new_today[day] += conn.execute("INSERT OR IGNORE INTO visitors_day (day, uid) VALUES (?, ?)", (day, uid)).rowcount
+            # max-merge in SQL, so concurrent workers never overwrite each other
+            conn.executemany(
+                "INSERT INTO visitor_sketches (day, registers) VALUES (?, ?) "
+                "ON CONFLICT (day) DO UPDATE SET registers = hll_merge(visitor_sketches.registers, excluded.registers)",
+                [(day, bytes(sk.registers)) for day, sk in sketches],
+            )
+    except sqlite3.Error:
+        DB_EVENTS.extendleft(reversed(events))  # keep them for the next tick
+        DB_SKETCHES.update(sketches)
+        return 0
+    finally:
+        conn.close()
+
+    counters = DAY.counters
+    if counters is not None and (new_total or new_today):
+        counters.add_visitors(new_today.get(int(DAY.start_ts), 0), new_total)
+    return len(events)
+
+def db_spend(day_key: int, uid: str, vids):
+    # -> boosts landed. Debits BOOST_COST per vid, in order, while the user's
+    # shared balance covers it; the WHERE guard makes the check and the debit
+    # one atomic step across every worker.
+    conn = db_thread_conn()
+    landed = 0
+    with conn:
+        if vids:
+            conn.execute("INSERT OR IGNORE INTO users (day, uid, points) VALUES (?, ?, ?)", (day_key, uid, DEFAULT_POINTS))
+        for _ in vids:
+            if not conn.execute(
+                    "UPDATE users SET points = points - ? WHERE day = ? AND uid = ? AND points >= ?",
+                    (BOOST_COST, day_key, uid, BOOST_COST)).rowcount:
+                break
+            landed += 1
+        conn.executemany(
+            "INSERT INTO boosts (day, uid, vid, n) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (day, uid, vid) DO UPDATE SET n = boosts.n + excluded.n",
+            [(day_key, uid, vid, n) for vid, n in Counter(vids[:landed]).items()],
+        )
+    return landed
+
+def db_user(day_key: int, uid: str):
+    # -> (points, {vid: boosts}) across every worker, or None before the first boost
+    conn = db_thread_conn()
+    row = conn.execute("SELECT points FROM users WHERE day = ? AND uid = ?", (day_key, uid)).fetchone()
+    if row is None:
+        return None
+    return row[0], dict(conn.execute("SELECT vid, n FROM boosts WHERE day = ? AND uid = ?", (day_key, uid)))
+
+def db_flusher():
+    while True:
+        time.sleep(DB_FLUSH_SEC)
+        try:
+            db_flush()
+        except Exception:
+            pass
+
+def db_load_day(day: DailyState):
+    key = int(day.start_ts)
+    conn = db_connect()
+    try:
+        # points are derived from boosts, so the users table is not needed here
+        for uid, vid, n in conn.execute("SELECT uid, vid, n FROM boosts WHERE day = ?", (key,)):
+            slot = day.slot(vid)
+            u = day.users.get(uid)
+            if u is None:
+                u = day.users[uid] = User()
+            u.boosts.extend([slot] * n)
+            day.totals[slot] += n
+        if VISITOR_COUNT_MODE == "exact":
+            day.visitor_uids = {uid for (uid,) in conn.execute("SELECT uid FROM visitors_day WHERE day = ?", (key,))}
+        else:
+            day.visitor_sketch = db_load_sketch(conn, key, "SELECT uid FROM visitors_day WHERE day = ?", (key,))
+    finally:
+        conn.close()
+    for vid, n in day.boost_totals().items():
+        day.leaderboard.set_boosts(vid, n)
+
+def db_load_sketch(conn, key: int, uids_sql: str, args=()):
+    row = conn.execute("SELECT registers FROM visitor_sketches WHERE day = ?", (key,)).fetchone()
+    if row is not None and len(row[0]) == HLL_M:
+        return HyperLogLog(bytearray(row[0]))
+    # no sketch yet: fold in uids recorded while running in exact mode
+    sketch = HyperLogLog()
+    for (uid,) in conn.execute(uids_sql, args):
+        sketch.add(uid)
+    return sketch
+
+def db_load_visitors():
+    global VISITOR_UIDS_TOTAL, VISITOR_SKETCH_TOTAL
+    conn = db_connect()
+    try:
+        if VISITOR_COUNT_MODE == "exact":
+            VISITOR_UIDS_TOTAL = {uid for (uid,) in conn.execute("SELECT uid FROM visitors")}
+        else:
+            VISITOR_SKETCH_TOTAL = db_load_sketch(conn, 0, "SELECT uid FROM visitors")
+    finally:
+        conn.close()
+
+db_init()
+db_load_visitors()
+atexit.register(db_flush)
+threading.Thread(target=db_flusher, name="db-flush", daemon=True).start()
+
+def db_visitor_counts(day_start_ts: float):
+    if VISITOR_COUNT_MODE != "exact":
+        return 0, 0
+    conn = db_connect()
+    try:
+        total = conn.execute("SELECT COUNT(*) FROM visitors").fetchone()[0]
+        today = conn.execute("SELECT COUNT(*) FROM visitors_day WHERE day = ?", (int(day_start_ts),)).fetchone()[0]
+    finally:
+        conn.close()
+    return today, total
+
+# -----------------------------
+# Cross-worker counters: a memory-mapped file (in /dev/shm when available)
+# sized to the day's video set. Per-video boost totals, the boost/visitor
+# totals, the day/all-time HyperLogLog registers and generation numbers
+# live here; every worker maps the same file. Increments take a byte-range
+# lockf on the field they touch; reads are plain loads from the mapping,
+# no syscall and no lock.
+# -----------------------------
+SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else STATE_DIR
+COUNTERS_MAGIC = b"VSRCNT02"
+COUNTERS_HEADER = struct.Struct("<8sqqqqqqq")  # magic, day, nslots, generation, boosts, visitors_today, visitors_total, visitors generation
+COUNTERS_SLOT = struct.Struct("<16sq")         # vid (NUL padded), boosts; slots are followed by 2 x HLL_M registers
+OFF_GEN, OFF_BOOSTS, OFF_VIS_TODAY, OFF_VIS_TOTAL, OFF_VIS_GEN = 24, 32, 40, 48, 56
+
+def counters_path(day_start_ts: float) -> str:
+    tag = hashlib.sha1(os.path.abspath(STATE_DIR).encode()).hexdigest()[:8]
+    return os.path.join(SHM_DIR, f"vsr-{tag}-{int(day_start_ts)}.cnt")
+
+class SharedCounters:
+    def __init__(self, path: str, day_start_ts: float, videos, seed_boosts: dict, seed_visitors):
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self.fd).st_size == 0:
+                # first worker for the day lays out the file from the database
+                vids = list(videos)
+                buf = bytearray(COUNTERS_HEADER.size + COUNTERS_SLOT.size * len(vids) + 2 * HLL_M)
+                COUNTERS_HEADER.pack_into(
+                    buf, 0, COUNTERS_MAGIC, int(day_start_ts), len(vids), 0,
+                    sum(seed_boosts.get(v, 0) for v in vids), seed_visitors[0], seed_visitors[1], 0)
+                for i, vid in enumerate(vids):
+                    COUNTERS_SLOT.pack_into(buf, COUNTERS_HEADER.size + i * COUNTERS_SLOT.size, vid.encode(), seed_boosts.get(vid, 0))
+                os.write(self.fd, bytes(buf))
+            size = os.fstat(self.fd).st_size
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        self.mm = mmap.mmap(self.fd, size)
+        magic, _, nslots = COUNTERS_HEADER.unpack_from(self.mm, 0)[:3]
+        if magic != COUNTERS_MAGIC:
+            raise ValueError(f"bad counters file {path}")
+        # slot offsets come from the file, so a worker with a different local
+        # video list still agrees with everyone else on where each vid lives
+        self.offsets = {}
+        for i in range(nslots):
+            off = COUNTERS_HEADER.size + i * COUNTERS_SLOT.size
+            vid = COUNTERS_SLOT.unpack_from(self.mm, off)[0].rstrip(b"\0").decode()
+            self.offsets[vid] = off + 16
+        self.hll_today = COUNTERS_HEADER.size + nslots * COUNTERS_SLOT.size
+        self.hll_total = self.hll_today + HLL_M
+        self.vis_gen, self.vis_est = -1, (0, 0)
+        self.lock = threading.Lock()  # lockf is per process; this covers our own threads
+
+    def _read(self, off: int) -> int:
+        return struct.unpack_from("<q", self.mm, off)[0]
+
+    def _add(self, off: int, delta: int) -> int:
+        with self.lock:
+            fcntl.lockf(self.fd, fcntl.LOCK_EX, 8, off)
+            try:
+                v = self._read(off) + delta
+                struct.pack_into("<q", self.mm, off, v)
+            finally:
+                fcntl.lockf(self.fd, fcntl.LOCK_UN, 8, off)
+        return v
+
+    def get(self, vid: str) -> int:
+        off = self.offsets.get(vid)
+        return 0 if off is None else self._read(off)
+
+    def add_boost(self, vid: str, n: int = 1) -> int:
+        off = self.offsets.get(vid)
+        if off is None:
+            return 0
+        v = self._add(off, n)
+        self._add(OFF_BOOSTS, n)
+        self._add(OFF_GEN, 1)
+        return v
+
+    def add_visitors(self, today: int, total: int):
+        if today:
+            self._add(OFF_VIS_TODAY, today)
+        if total:
+            self._add(OFF_VIS_TOTAL, total)
+
+    def add_visit(self, uid: str) -> bool:
+        # same as HyperLogLog.add, with the byte locked across processes
+        idx, rank = hll_point(uid)
+        raised = False
+        for off in (self.hll_today + idx, self.hll_total + idx):
+            if self.mm[off] >= rank:
+                continue
+            with self.lock:
+                fcntl.lockf(self.fd, fcntl.LOCK_EX, 1, off)
+                try:
+                    if self.mm[off] < rank:
+                        self.mm[off] = rank
+                        raised = True
+                finally:
+                    fcntl.lockf(self.fd, fcntl.LOCK_UN, 1, off)
+        if raised:
+            self._add(OFF_VIS_GEN, 1)
+        return raised
+
+    def merge_visitors(self, today: HyperLogLog, total: HyperLogLog):
+        for off, sketch in ((self.hll_today, today), (self.hll_total, total)):
+            with self.lock:
+                fcntl.lockf(self.fd, fcntl.LOCK_EX, HLL_M, off)
+                try:
+                    self.mm[off:off + HLL_M] = hll_merge(self.mm[off:off + HLL_M], sketch.registers)
+                finally:
+                    fcntl.lockf(self.fd, fcntl.LOCK_UN, HLL_M, off)
+        self._add(OFF_VIS_GEN, 1)
+
+    def visitor_estimates(self):
+        # -> (today, total); re-estimated only after some worker raised a register
+        gen = self._read(OFF_VIS_GEN)
+        if gen != self.vis_gen:
+            self.vis_est = (
+                hll_estimate(self.mm[self.hll_today:self.hll_today + HLL_M]),
+                hll_estimate(self.mm[self.hll_total:self.hll_total + HLL_M]),
+            )
+            self.vis_gen = gen
+        return self.vis_est
+
+    def generation(self) -> int:
+        return self._read(OFF_GEN)
+
+    def boosts(self) -> int:
+        return self._read(OFF_BOOSTS)
+
+    def visitors(self):
+        return self._read(OFF_VIS_TODAY), self._read(OFF_VIS_TOTAL)
+
+    def close(self):
+        try:
+            self.mm.close()
+        finally:
+            os.close(self.fd)
+
+def attach_counters(day: DailyState):
+    if fcntl is None or not day.videos:
+        return
+    path = counters_path(day.start_ts)
+    try:
+        day.counters = SharedCounters(path, day.start_ts, day.videos, day.boost_totals(), db_visitor_counts(day.start_ts))
+    except (OSError, ValueError):
+        day.counters = None
+        return
+    if VISITOR_COUNT_MODE != "exact":
+        day.counters.merge_visitors(day.visitor_sketch, VISITOR_SKETCH_TOTAL)
+    day.sync_shared()
+    # files of past days are dead weight in /dev/shm
+    prefix = os.path.basename(path).rsplit("-", 1)[0] + "-"
+    for name in os.listdir(SHM_DIR):
+        if name.startswith(prefix) and name.endswith(".cnt") and name < os.path.basename(counters_path(day.start_ts - 86400)):
+            try:
+                os.remove(os.path.join(SHM_DIR, name))
+            except OSError:
+                pass
+
+DAY = DailyState(utc_midnight_ts(), {})
+db_load_day(DAY)
+DAY.install_videos(load_videos_snapshot(DAY.start_ts) or {})
+
+def warm_videos(day: DailyState):
+    while day is DAY and day.warming:
+        videos = build_or_load_videos(day.start_ts)
+        if videos and day is DAY:
+            day.install_videos(videos)
+            return
+        time.sleep(VIDEOS_RETRY_SEC)
+
+def start_video_warmup(day: DailyState):
+    if day.warming:
+        threading.Thread(target=warm_videos, args=(day,), name="videos-warmup", daemon=True).start()
+
 # -----------------------------
-VISITOR_UIDS_TOTAL = set()
-VISITOR_TOTAL = 0
-VISITOR_UIDS_TODAY = set()
-VISITOR_TODAY = 0
-
-def ensure_daily_reset():
-    global VIDEOS, USERS, DAY_START_TS
-    global VISITOR_UIDS_TODAY, VISITOR_TODAY
-
-    if time.time() - DAY_START_TS >= 86400:
-        VIDEOS = build_daily_videos(limit=12)
-        USERS = {}
-        DAY_START_TS = utc_midnight_ts()
-        VISITOR_UIDS_TODAY = set()
-        VISITOR_TODAY = 0
-
-def track_visit(uid: str):
-    global VISITOR_TOTAL, VISITOR_TODAY
-    if uid not in VISITOR_UIDS_TOTAL:
-        VISITOR_UIDS_TOTAL.add(uid)
-        VISITOR_TOTAL += 1
-    if uid not in VISITOR_UIDS_TODAY:
-        VISITOR_UIDS_TODAY.add(uid)
-        VISITOR_TODAY += 1
+# Day scheduler: tomorrow's set is built ahead of midnight, so the reset is
+# a single pointer flip and request handlers never do network I/O for it
+# -----------------------------
+DAY_PREBUILD_LEAD_SEC = 900  # start building tomorrow's set 15 min before 00:00 UTC
+DAY_FLIP_LOCK = threading.Lock()
+DAY_RETIRE_SEC = 60  # grace for requests still holding the old day before its counters are closed
+NEXT_DAY = {"start_ts": 0.0, "videos": None}
+
+def flip_day(start_ts: float):
+    global DAY
+    with DAY_FLIP_LOCK:
+        if DAY.start_ts >= start_ts:
+            return DAY
+        videos = NEXT_DAY["videos"] if NEXT_DAY["start_ts"] == start_ts else None
+        if videos is None:
+            videos = load_videos_snapshot(start_ts) or {}  # local disk only
+        day = DailyState(start_ts, {})
+        db_load_day(day)
+        day.install_videos(videos)
+        old, DAY = DAY, day
+    timer = threading.Timer(DAY_RETIRE_SEC, old.retire)
+    timer.daemon = True
+    timer.start()
+    start_video_warmup(DAY)
+    return DAY
+
+def day_scheduler():
+    while True:
+        try:
+            next_start = DAY.start_ts + 86400
+            now = time.time()
+            if now >= next_start:
+                flip_day(utc_midnight_ts())
+                continue
+            if now >= next_start - DAY_PREBUILD_LEAD_SEC and NEXT_DAY["start_ts"] != next_start:
+                videos = build_or_load_videos(next_start)
+                if videos:
+                    NEXT_DAY.update({"start_ts": next_start, "videos": videos})
+                else:
+                    time.sleep(VIDEOS_RETRY_SEC)
+                continue
+            wake = next_start if NEXT_DAY["start_ts"] == next_start else next_start - DAY_PREBUILD_LEAD_SEC
+            time.sleep(min(max(wake - now, 0.5), 30))
+        except Exception:
+            time.sleep(5)
+
+def ensure_daily_reset() -> DailyState:
+    # fallback if a request beats the scheduler past midnight; disk at most
+    day = DAY
+    if time.time() - day.start_ts >= 86400:
+        day = flip_day(utc_midnight_ts())
+    return day
+
+def track_visit(uid: str, day: DailyState):
+    if VISITOR_COUNT_MODE != "exact":
+        raised = day.visitor_sketch.add(uid)
+        if VISITOR_SKETCH_TOTAL.add(uid) or raised:
+            DB_SKETCHES[int(day.start_ts)] = day.visitor_sketch
+            DB_SKETCHES[0] = VISITOR_SKETCH_TOTAL
+        if day.counters is not None:
+            day.counters.add_visit(uid)
+        return
+    VISITOR_UIDS_TOTAL.add(uid)
+    if uid not in day.visitor_uids:
+        day.visitor_uids.add(uid)  # a racing duplicate event is harmless (INSERT OR IGNORE)
+        DB_EVENTS.append(("visit", int(day.start_ts), uid))
 
 # -----------------------------
 # User helpers
@@ -281,60 +1449,167 @@ def track_visit(uid: str):
 def get_uid():
     return request.cookies.get(COOKIE_NAME) or uuid.uuid4().hex
 
-def get_user(uid: str):
-    if uid not in USERS:
-        USERS[uid] = {"points": 1000, "boosts": {}}
-    return USERS[uid]
+BOOST_BATCH_MAX = 50
+
+# Striped locks: a boost is check-then-act on the user's points, so requests
+# for one uid serialize on that uid's stripe, and a video's total takes its
+# slot's stripe. Unrelated users/videos rarely share a stripe, so boosts
+# still run in parallel instead of behind one site-wide lock.
+LOCK_STRIPES = 64
+USER_LOCKS = [threading.Lock() for _ in range(LOCK_STRIPES)]
+VIDEO_LOCKS = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+def user_lock(uid: str):
+    return USER_LOCKS[hash(uid) % LOCK_STRIPES]
+
+def video_lock(slot: int):
+    return VIDEO_LOCKS[slot % LOCK_STRIPES]
+
+# Records are created by the first boost that lands, so they exist only for
+# uids that boosted today and die with the day's DailyState; everyone else
+# reads the shared default, and page views allocate nothing per visitor.
+DEFAULT_USER = User()  # shared, never mutated
+
+def get_user(uid: str, day: DailyState):
+    return day.users.get(uid) or DEFAULT_USER
+
+def materialize_user(uid: str, day: DailyState):
+    me = day.users.get(uid)
+    if me is None:
+        me = day.users.setdefault(uid, User())
+    return me
+
+def ledger_user(uid: str, day: DailyState):
+    # -> (points, {vid: boosts}) as every worker sees them; this worker's
+    # record only if the ledger can't be read
+    try:
+        row = db_user(int(day.start_ts), uid)
+    except sqlite3.Error:
+        me = get_user(uid, day)
+        return me.points, me.boost_counts(day)
+    return row or (DEFAULT_POINTS, {})
 
 # -----------------------------
-# Scoring / ranking
+# Boost index / scores
 # -----------------------------
-def total_boosts(vid: str) -> int:
-    return sum(u["boosts"].get(vid, 0) for u in USERS.values())
-
-def viral_score(vid: str) -> float:
+def total_boosts(vid: str, day: DailyState) -> int:
+    # all workers' boosts when the shared counters are mapped, else this process's
+    if day.counters is not None:
+        return day.counters.get(vid)
+    slot = day.slot_of.get(vid)
+    return 0 if slot is None else day.totals[slot]
+
+def boosts_today(day: DailyState) -> int:
+    if day.counters is not None:
+        return day.counters.boosts()
+    return sum(day.totals)
+
+def visitor_counts(day: DailyState):
+    # -> (today, total)
+    if VISITOR_COUNT_MODE != "exact":
+        if day.counters is not None:
+            return day.counters.visitor_estimates()
+        return day.visitor_sketch.count(), VISITOR_SKETCH_TOTAL.count()
+    if day.counters is not None:
+        return day.counters.visitors()
+    return len(day.visitor_uids), len(VISITOR_UIDS_TOTAL)
+
+def record_boost(day: DailyState, uid: str, me: User, vid: str):
+    slot = day.slot_of[vid]
+    me.boosts.append(slot)
+    with video_lock(slot):
+        day.totals[slot] += 1
+    if day.counters is not None:
+        day.leaderboard.set_boosts(vid, day.counters.add_boost(vid))
+    else:
+        day.leaderboard.set_boosts(vid, day.totals[slot])
+
+def apply_boosts(day: DailyState, uid: str, vids):
+    # -> (applied vids, [{"vid", "error"}]); stops spending once
+    # points run out. Points are checked and debited in the shared ledger
+    # (db_spend); the local record is created by the first boost that lands.
+    known = [vid for vid in vids if vid in day.videos]
+    with user_lock(uid):
+        try:
+            landed, error = db_spend(int(day.start_ts), uid, known), "not enough points"
+        except sqlite3.Error:
+            landed, error = 0, "busy, try again"
+        applied, rejected = [], []
+        for vid in vids:
+            if vid not in day.videos:
+                rejected.append({"vid": vid, "error": "unknown video"})
+            elif len(applied) < landed:
+                record_boost(day, uid, materialize_user(uid, day), vid)
+                applied.append(vid)
+            else:
+                rejected.append({"vid": vid, "error": error})
+    return applied, rejected
+
+BOOST_INDEX_CHECK = os.environ.get("VSR_BOOST_INDEX_CHECK") == "1"  # debug route, O(users) per call
+
+def check_boost_index(day: DailyState):
+    # full recount from users; returns {vid: (indexed, actual)} for every mismatch
+    actual = Counter()
+    for u in list(day.users.values()):
+        actual.update(u.boosts)
+    drift = {}
+    for slot, indexed in enumerate(day.totals):
+        if indexed != actual.get(slot, 0):
+            drift[day.slot_vids[slot]] = (indexed, actual.get(slot, 0))
+    return drift
+
+def viral_score(vid: str, day: DailyState) -> float:
     base = 30
-    boost_score = total_boosts(vid) * 50
-    age_hours = max((time.time() - VIDEOS[vid]["first_seen"]) / 3600, 1)
+    boost_score = total_boosts(vid, day) * 50
+    age_hours = max((time.time() - day.videos[vid]["first_seen"]) / 3600, 1)
     time_score = max(40 - age_hours, 0)
     return round(base + boost_score + time_score, 1)
 
-def build_view_model(uid: str):
-    me = get_user(uid)
-
-    items = []
-    for vid, meta in VIDEOS.items():
-        my_boost = me["boosts"].get(vid, 0)
-        tot = total_boosts(vid)
-        score = viral_score(vid)
-        items.append({
-            "id": vid,
-            "url": meta["url"],
-            "thumb": meta["thumb"],
-            "my_boost": my_boost,
-            "total_boost": tot,
-            "score": score,
-        })
+FEED_PAGE_SIZE = 12  # cards rendered into the page; the rest load from /api/feed
+FEED_PAGE_MAX = 50
+FEED_FIELDS = ("id", "url", "thumb", "thumb_hq", "total_boost", "score", "rank")
+
+def feed_item(day: DailyState, vid: str, rank: int, my_boosts=None):
+    return {
+        "id": vid,
+        "url": day.videos[vid]["url"],
+        "thumb": thumb_url(vid, "mq"),
+        "thumb_hq": thumb_url(vid),
+        "my_boost": (my_boosts or {}).get(vid, 0),
+        "total_boost": total_boosts(vid, day),
+        "score": viral_score(vid, day),
+        "rank": rank,
+    }
 
-    items.sort(key=lambda x: x["score"], reverse=True)
-    for i, it in enumerate(items, start=1):
-        it["rank"] = i
+def build_view_model(day: DailyState, me=None, limit=None):
+    # me=None renders the shared (anonymous) view: zero personal boosts;
+    # limit keeps the cost flat however large the daily pool is
+    my_boosts = me.boost_counts(day) if me else {}
+    day.sync_shared()
 
+    items = [feed_item(day, vid, rank, my_boosts) for rank, vid in day.leaderboard.page(None, limit or len(day.leaderboard))]
     winner = items[0] if items else None
-    return me, items, winner
+    return items, winner
+
+def feed_cursor(day: DailyState, vid: str) -> str:
+    # keyset cursor: the last entry's boosts + vid, which pin its leaderboard key
+    return f"{-day.leaderboard.key_of[vid][0]}.{vid}"
+
+def feed_cursor_key(day: DailyState, cursor: str):
+    boosts, _, vid = cursor.partition(".")
+    key = day.leaderboard.key_of.get(vid)
+    if key is None or not boosts.isdigit():
+        return None
+    return (-int(boosts),) + key[1:]
+
+start_video_warmup(DAY)
+threading.Thread(target=day_scheduler, name="day-scheduler", daemon=True).start()
 
 
 # -----------------------------
 # UI (kept) + NEWS-only changes
 # -----------------------------
-HTML = r"""
-<!doctype html>
-<html>
-<head>
-<meta charset="utf-8"/>
-<meta name="viewport" content="width=device-width, initial-scale=1"/>
-<title>Viral Shorts Radar</title>
-<style>
+CSS = r"""
 :root{
   --bg:#0f0f0f; --card:#1a1a1a; --muted:#aaa; --accent:#00ffcc;
   --hot:#ff3300; --boost:#ff6600; --gold:#ffcc00; --pill:#222;
@@ -426,7 +1701,7 @@ a { color:var(--accent); text-decoration:none; }
 .badge.hot{ background:var(--hot); color:#fff; left:auto; right:10px; }
 .badge.winner{ background:var(--accent); color:#00110c; left:auto; right:10px; top:auto; bottom:10px; }
 
-.thumb{ width:100%; border-radius:12px; display:block; }
+.thumb{ width:100%; border-radius:12px; display:block; aspect-ratio:4/3; object-fit:contain; background:#000; }
 .titlelink{ display:block; margin-top:8px; font-weight:900; text-align:center; }
 .meta{ margin-top:6px; color:var(--muted); font-size:12px; text-align:center; }
 .score{ margin-top:6px; color:var(--accent); font-weight:900; text-align:center; }
@@ -731,279 +2006,293 @@ hr.sep{ border:0; border-top:1px solid #232323; margin:16px 0; }
   .leaderNews .step{ margin:0 auto; max-height:none; overflow:visible; }
   .newsList{ max-height: 360px; }
 }
-</style>
-</head>
-<body>
-<div class="container">
+"""
 
-  <div class="nav">
-    <div class="brand">Viral<span>Radar</span></div>
-    <div class="nav-right">
-      <div class="chip">Reset: <b>00:00 UTC</b></div>
-      <div class="chip">Points: <b>{{ my_points }}</b></div>
-      <button class="btn secondary" onclick="document.getElementById('how').scrollIntoView({behavior:'smooth'});">How it works</button>
-      <button class="btn" onclick="alert('Wallet connect coming next.\\nWe will keep this smooth & cheap (Solana).');">Connect Wallet</button>
-    </div>
-  </div>
+JS = r"""
+  const resetAtMs = Number(document.body.dataset.resetAt);
 
-  <div class="hero">
-    <div class="visitorsOverlay" aria-label="Visitors">
-      <div class="chip">Today: <b>{{ visitors_today }}</b></div>
-      <div class="chip">Total: <b>{{ visitors_total }}</b></div>
-    </div>
+  function pad(n){ return String(n).padStart(2,'0'); }
+  function tick(){
+    let diff = resetAtMs - Date.now();
+    if (diff < 0) diff = 0;
+    const totalSec = Math.floor(diff / 1000);
+    const h = Math.floor(totalSec / 3600);
+    const m = Math.floor((totalSec % 3600) / 60);
+    const s = totalSec % 60;
+    const el = document.getElementById("resetCountdownHero");
+    if (el) el.textContent = `${pad(h)}:${pad(m)}:${pad(s)}`;
+  }
+  tick();
+  setInterval(tick, 1000);
 
-    <div class="h-title">Boost what goes <span class="accent">viral</span>.</div>
-    <div class="h-sub">
-      A daily radar of trending Shorts — boosted by the community.
-      Spend points now, plug in the token later. Same UX.
-    </div>
-    <div class="cta">
-      <button class="btn" onclick="document.getElementById('feed').scrollIntoView({behavior:'smooth'});">Enter the Feed</button>
-      <button class="btn secondary" onclick="alert('Token utility (draft):\\nBOOST = burn-to-boost attention.\\nBoost 100 -> 70% burn / 20% creator pool / 10% ops.');">Token Draft</button>
-    </div>
-    <div class="smallnote">MVP: server restart = new day. Daily reset at 00:00 UTC.</div>
+  function tickUTC(){
+    const d = new Date();
+    const Y = d.getUTCFullYear();
+    const M = String(d.getUTCMonth() + 1).padStart(2,'0');
+    const D = String(d.getUTCDate()).padStart(2,'0');
+    const h = String(d.getUTCHours()).padStart(2,'0');
+    const m = String(d.getUTCMinutes()).padStart(2,'0');
+    const s = String(d.getUTCSeconds()).padStart(2,'0');
+    const el = document.getElementById("utcNow");
+    if (el) el.textContent = `${Y}-${M}-${D} ${h}:${m}:${s} UTC`;
+  }
+  tickUTC();
+  setInterval(tickUTC, 1000);
 
-    <div class="countdown-wrap">
-      <div class="countdown">
-        <span class="label">RESET IN</span>
-        <b class="time" id="resetCountdownHero">--:--:--</b>
-        <span style="color:#777; font-size:12px;">(UTC)</span>
-      </div>
-    </div>
+  function showCenterNotice(msg){
+    const box = document.getElementById("centerNotice");
+    const text = document.getElementById("centerNoticeText");
+    if(!box || !text) return;
+    text.textContent = msg;
+    box.classList.add("show");
+    clearTimeout(window.__centerNoticeTimer);
+    window.__centerNoticeTimer = setTimeout(() => box.classList.remove("show"), 1800);
+  }
 
-    <div style="margin-top:8px; text-align:center; color:#888; font-size:12px;">
-      UTC Now: <b id="utcNow">----</b>
-    </div>
+  function buildPackText(d){
+    return `Name: ${d.name}
+Ticker: ${d.ticker}
 
-  {% if winner %}
-  <div class="panel">
-    <h2>🏆 Today’s Leader</h2>
+Description:
+${d.description}
 
-    <div class="leaderGrid">
+Source:
+${d.source_url}
+`;
+  }
 
-      <!-- ✅ NEWS BOX (ONLY AREA we modify) -->
-      <div class="leaderNews">
-        <div class="how leader-steps" style="align-items:center;">
-          <div class="step">
-            <div class="newsTopRow">
-              <b>📰 Trending News</b>
-            </div>
-            <div class="newsRefresh" id="newsRefreshLabel">Refresh in 60s</div>
+  // per-user overlay: the page itself is shared and cacheable, the personal
+  // values (points, my boosts, visitor chips) come from /api/me
+  let myBoosts = {};  // vid -> my boosts, for cards loaded after /api/me
 
-            <div class="newsList" id="newsList">
-              {% for n in news %}
-              <div class="newsItem {% if loop.index == 1 %}top1{% endif %}">
-                <div class="newsRank">{{ loop.index }}</div>
-                <a href="https://www.google.com/search?q={{ n.q }}" target="_blank" rel="noopener noreferrer">
-                  {{ n.title }}
-                </a>
-                <div class="newsMeta">
-                  Sources: <b>{{ n.sources }}</b> • Mentions: <b>{{ n.mentions }}</b>
-                </div>
-              </div>
-              {% endfor %}
-              {% if not news %}
-              <div class="newsItem">
-                <div class="newsRank">1</div>
-                <a href="https://www.google.com/search?q=breaking+news" target="_blank" rel="noopener noreferrer">
-                  No news yet — click to search.
-                </a>
-                <div class="newsMeta">Try again in a moment.</div>
-              </div>
-              {% endif %}
-            </div>
-
-            <div class="newsHint">Click a title → Google search</div>
-          </div>
-        </div>
-      </div>
-
-      <div class="leaderLeft">
-        <div class="leaderVideo">
-          <img class="thumb" src="{{ winner.thumb }}" />
-          <a class="titlelink" href="{{ winner.url }}" target="_blank">▶ Watch #1 Shorts</a>
-          <div class="meta">Total Boosts: <b>{{ winner.total_boost }}</b> • Your Boosts: <b>{{ winner.my_boost }}</b></div>
-          <div class="score">🔥 Viral Score: {{ winner.score }}</div>
-
-          <button
-            type="button"
-            class="btn secondary pump"
-            data-vid="{{ winner.id }}"
-            style="display:inline-flex; align-items:center; justify-content:center; gap:10px; text-align:center;"
-          >
-            <svg width="30" height="30" viewBox="0 0 128 128" aria-hidden="true" style="display:block;">
-              <g transform="translate(64 64) rotate(-35) translate(-64 -64)">
-                <rect x="14" y="26" width="100" height="76" rx="38" fill="#0a2f2a" opacity="0.85"/>
-                <rect x="18" y="30" width="92" height="68" rx="34" fill="#ffffff" opacity="0.18"/>
-                <rect x="22" y="34" width="84" height="60" rx="30" fill="#eafff5"/>
-                <path d="M22 94 L22 34 L58 34 L106 94 Z" fill="#22c55e"/>
-                <path d="M58 34 H106 V94 H86 Z" fill="#ffffff"/>
-                <path d="M52 34 H70 L106 94 H88 Z" fill="#0a2f2a" opacity="0.55"/>
-                <path d="M34 76 C29 68 29 56 37 49" fill="none" stroke="#ffffff" stroke-width="8" stroke-linecap="round" opacity="0.85"/>
-                <path d="M46 88 C41 81 41 70 48 63" fill="none" stroke="#ffffff" stroke-width="6" stroke-linecap="round" opacity="0.55"/>
-              </g>
-            </svg>
-            <span style="display:inline-block; line-height:1; text-align:center;">Mint on Pump.fun</span>
-          </button>
-
-          <div style="display:flex; gap:10px; justify-content:center; margin-top:10px;">
-            <button type="button" class="btn secondary" id="copyPackBtn" data-vid="{{ winner.id }}">
-              Copy Pack (Text + Image)
-            </button>
-          </div>
+  function applyMe(me){
+    const boosts = me.boosts || {};
+    myBoosts = boosts;
+    document.querySelectorAll("[data-me]").forEach((el) => {
+      const v = me[el.dataset.me];
+      if (v !== undefined) el.textContent = v;
+    });
+    document.querySelectorAll("[data-my-boost]").forEach((el) => {
+      el.textContent = boosts[el.dataset.myBoost] || 0;
+    });
+    document.querySelectorAll(".card[data-vid]").forEach((card) => {
+      setCardBoosted(card, boosts[card.dataset.vid] || 0);
+    });
+  }
 
-        </div>
-      </div>
+  function toggleBadge(card, cls, text, on){
+    let badge = card.querySelector(`.badge.${cls}`);
+    if (on && !badge) {
+      badge = document.createElement("div");
+      badge.className = `badge ${cls}`;
+      badge.textContent = text;
+      card.insertBefore(badge, card.querySelector("img.thumb"));
+    } else if (!on && badge) {
+      badge.remove();
+    }
+  }
 
-      <div class="leaderRight">
-        <div class="how leader-steps">
-          <div class="step">
-            <b>🚀 Boost-to-Rank</b>
-            <p>Boost a video to push it up the feed. The UX is the token utility.</p>
-          </div>
-          <div class="step">
-            <b>🔥 Burn-to-Boost (next)</b>
-            <p>Replace points with token burning. Spend → burn → rank.</p>
-          </div>
-          <div class="step">
-            <b>🗳 Community Picks (next)</b>
-            <p>Daily winner gets highlighted. Later: creator reward pool.</p>
-          </div>
-        </div>
-      </div>
+  function setCardBoosted(card, n){
+    card.classList.toggle("boosted", n > 0);
+    toggleBadge(card, "boosted", "BOOSTED", n > 0);
+  }
 
-    </div>
-  </div>
-  {% endif %}
+  // the server moved on to a new day's videos: this grid can't be patched,
+  // so reload, spread out so open tabs don't all hit the server at once
+  let reloading = false;
+  function isNewDay(data){
+    return data.day !== undefined && data.day > resetAtMs / 1000 - 86400;
+  }
+  function reloadForNewDay(){
+    if (reloading) return;
+    reloading = true;
+    setTimeout(() => window.location.reload(), Math.random() * 5000);
+  }
 
-  <div class="panel" id="how">
-    <h2>How it works</h2>
-    <div class="how">
-      <div class="step">
-        <b>1) Daily Drop</b>
-        <p>We fetch a fresh Shorts set. Reset at <b>00:00 UTC</b> (and on server restart in MVP).</p>
-      </div>
-      <div class="step">
-        <b>2) Boost</b>
-        <p>Boost costs <b>100</b> points. Your boosts are tracked per browser (cookie).</p>
-      </div>
-      <div class="step">
-        <b>3) Rank</b>
-        <p>Ranking is driven by community boosts + time decay. Top videos get <b>HOT</b>.</p>
-      </div>
-      <div class="step">
-        <b>4) Token (next)</b>
-        <p>Points become a token. Boost becomes burn-to-boost attention.</p>
-      </div>
-    </div>
-    <hr class="sep"/>
-    <div class="kpis">
-      <div class="pill">Your Points: <b>{{ my_points }}</b></div>
-      <div class="pill">Feed Size: <b>{{ feed_size }}</b></div>
-      <div class="pill">Total Boosts Today: <b>{{ total_boosts_today }}</b></div>
-    </div>
-  </div>
+  // in-place update from a /api/boost response or a pushed "board" event
+  // (no per-user fields): totals, scores, my boosts, then re-order the grid
+  // and move the HOT / #1 badges for changed ranks
+  function applyBoost(data){
+    if (isNewDay(data)) {
+      reloadForNewDay();
+      return;
+    }
+    if (data.points !== undefined) {
+      document.querySelectorAll('[data-me="points"]').forEach((el) => { el.textContent = data.points; });
+    }
+    document.querySelectorAll("[data-total-today]").forEach((el) => { el.textContent = data.total_boosts_today; });
+
+    Object.entries(data.videos || {}).forEach(([vid, v]) => {
+      document.querySelectorAll(`[data-total="${vid}"]`).forEach((el) => { el.textContent = v.total_boost; });
+      document.querySelectorAll(`[data-score="${vid}"]`).forEach((el) => { el.textContent = `🔥 Viral Score: ${v.score}`; });
+      if (v.my_boost === undefined) return;
+      myBoosts[vid] = v.my_boost;
+      document.querySelectorAll(`[data-my-boost="${vid}"]`).forEach((el) => { el.textContent = v.my_boost; });
+      const card = document.querySelector(`.card[data-vid="${vid}"]`);
+      if (card) setCardBoosted(card, v.my_boost);
+    });
 
-  <div id="feed" class="panel" style="padding-bottom:6px;">
-    <h2>🔥 Feed</h2>
-    <div style="color:#888; font-size:12px; text-align:center;">Boosted videos rise. Top 3 show <b>HOT</b>. Your boosts persist in this browser.</div>
-  </div>
+    const ranks = data.ranks || {};
+    if (Object.keys(ranks).length) {
+      const grid = document.querySelector(".grid");
+      const cards = Array.from(grid.querySelectorAll(".card[data-vid]"));
+      cards.forEach((card) => {
+        if (ranks[card.dataset.vid] !== undefined) card.dataset.rank = ranks[card.dataset.vid];
+        const rank = Number(card.dataset.rank);
+        toggleBadge(card, "hot", "🔥 HOT", rank <= 3);
+        toggleBadge(card, "winner", "🏆 #1", rank === 1);
+      });
+      cards.sort((a, b) => Number(a.dataset.rank) - Number(b.dataset.rank)).forEach((card) => grid.appendChild(card));
+    }
 
-  <div class="grid">
-  {% for v in videos %}
-    <div class="card {% if v.my_boost > 0 %}boosted{% endif %}">
-      {% if v.my_boost > 0 %}
-        <div class="badge boosted">BOOSTED</div>
-      {% endif %}
-      {% if v.rank <= 3 %}
-        <div class="badge hot">🔥 HOT</div>
-      {% endif %}
-      {% if v.rank == 1 %}
-        <div class="badge winner">🏆 #1</div>
-      {% endif %}
+    const leader = document.getElementById("copyPackBtn");
+    if (leader && data.winner && leader.dataset.vid !== data.winner) {
+      setLeader(data.winner, (data.videos || {})[data.winner]);
+      if (!document.querySelector(`.card[data-vid="${data.winner}"]`)) loadTopCard();
+    }
+  }
 
-      <img class="thumb" src="{{ v.thumb }}" />
-      <a class="titlelink" href="{{ v.url }}" target="_blank">▶ Watch Shorts</a>
-      <div class="meta">Your Boosts: <b>{{ v.my_boost }}</b> • Total: <b>{{ v.total_boost }}</b></div>
-      <div class="score">🔥 Viral Score: {{ v.score }}</div>
+  // the #1 changed: re-point the leader panel at the new winner in place,
+  // so no tab loses its scroll position or its lazily loaded cards. Values
+  // come from the event (v) when it has them, else from the winner's card.
+  function setLeader(vid, v){
+    const panel = document.querySelector(".leaderVideo");
+    if (!panel) return;
+    const card = document.querySelector(`.card[data-vid="${vid}"]`);
+    const fromCard = (sel, fallback) => {
+      const el = card && card.querySelector(sel);
+      return el ? el.textContent : fallback;
+    };
+    panel.querySelector("img.thumb").src = `/thumb/${vid}`;
+    const link = card && card.querySelector("a.titlelink");
+    panel.querySelector("a.titlelink").href = (v && v.url) || (link ? link.href : `https://www.youtube.com/shorts/${vid}`);
+
+    const total = panel.querySelector("[data-total]");
+    total.dataset.total = vid;
+    total.textContent = v && v.total_boost !== undefined ? v.total_boost : fromCard("[data-total]", "0");
+    const mine = panel.querySelector("[data-my-boost]");
+    mine.dataset.myBoost = vid;
+    mine.textContent = myBoosts[vid] || 0;
+    const score = panel.querySelector("[data-score]");
+    score.dataset.score = vid;
+    score.textContent = v && v.score !== undefined ? `🔥 Viral Score: ${v.score}` : fromCard("[data-score]", "");
+    panel.querySelectorAll("button[data-vid]").forEach((btn) => { btn.dataset.vid = vid; });
+  }
 
+  // ----------------------------
+  // Lazy feed: the page ships the top cards; the rest come from /api/feed
+  // a page at a time as the end of the grid scrolls into view
+  // ----------------------------
+  function cardHtml(v){
+    const my = myBoosts[v.id] || 0;
+    return `
+    <div class="card${my > 0 ? " boosted" : ""}" data-vid="${v.id}" data-rank="${v.rank}">
+      ${my > 0 ? '<div class="badge boosted">BOOSTED</div>' : ""}
+      ${v.rank <= 3 ? '<div class="badge hot">🔥 HOT</div>' : ""}
+      ${v.rank === 1 ? '<div class="badge winner">🏆 #1</div>' : ""}
+      <img class="thumb" src="${v.thumb}" loading="lazy" decoding="async" />
+      <a class="titlelink" href="${v.url}" target="_blank">▶ Watch Shorts</a>
+      <div class="meta">Your Boosts: <b data-my-boost="${v.id}">${my}</b> • Total: <b data-total="${v.id}">${v.total_boost}</b></div>
+      <div class="score" data-score="${v.id}">🔥 Viral Score: ${v.score}</div>
       <form method="post" action="/boost">
-        <input type="hidden" name="vid" value="{{ v.id }}"/>
+        <input type="hidden" name="vid" value="${v.id}"/>
         <button class="boost-btn">🚀 BOOST (-100)</button>
       </form>
-    </div>
-  {% endfor %}
-  </div>
-
-  <div class="footer">
-    MVP build. Next: wallet connect + burn-to-boost token flow.
-  </div>
-
-</div>
-
-<div class="centerNotice" id="centerNotice" aria-live="polite">
-  <div id="centerNoticeText">Ready to make a token. Check out the clipboard.</div>
-  <div class="sub">Paste on Pump.fun (Ctrl+V)</div>
-</div>
+    </div>`;
+  }
 
-<script>
-  const resetAtMs = {{ reset_at_ms }};
+  const FEED_ITEM_FIELDS = "id,url,thumb,total_boost,score,rank";
+  let feedLoading = false;
 
-  function pad(n){ return String(n).padStart(2,'0'); }
-  function tick(){
-    let diff = resetAtMs - Date.now();
-    if (diff < 0) diff = 0;
-    const totalSec = Math.floor(diff / 1000);
-    const h = Math.floor(totalSec / 3600);
-    const m = Math.floor((totalSec % 3600) / 60);
-    const s = totalSec % 60;
-    const el = document.getElementById("resetCountdownHero");
-    if (el) el.textContent = `${pad(h)}:${pad(m)}:${pad(s)}`;
+  // the new #1 came from below the loaded cards: fetch it and put it on top
+  async function loadTopCard(){
+    try{
+      const data = await (await fetch(`/api/feed?limit=1&fields=${FEED_ITEM_FIELDS}`)).json();
+      const v = data.ok && data.items[0];
+      const grid = document.querySelector(".grid");
+      if (!v || !grid || grid.querySelector(`.card[data-vid="${v.id}"]`)) return;
+      grid.insertAdjacentHTML("afterbegin", cardHtml(v));
+      const leader = document.getElementById("copyPackBtn");
+      if (leader && leader.dataset.vid === v.id) setLeader(v.id, v);
+    } catch(e){
+      console.error(e);
+    }
   }
-  tick();
-  setInterval(tick, 1000);
 
-  function tickUTC(){
-    const d = new Date();
-    const Y = d.getUTCFullYear();
-    const M = String(d.getUTCMonth() + 1).padStart(2,'0');
-    const D = String(d.getUTCDate()).padStart(2,'0');
-    const h = String(d.getUTCHours()).padStart(2,'0');
-    const m = String(d.getUTCMinutes()).padStart(2,'0');
-    const s = String(d.getUTCSeconds()).padStart(2,'0');
-    const el = document.getElementById("utcNow");
-    if (el) el.textContent = `${Y}-${M}-${D} ${h}:${m}:${s} UTC`;
+  // -> true when a page was appended
+  async function loadMoreCards(){
+    const grid = document.querySelector(".grid");
+    const next = grid && grid.dataset.next;
+    if (!next || feedLoading) return false;
+    feedLoading = true;
+    try{
+      const res = await fetch(`/api/feed?cursor=${encodeURIComponent(next)}&limit=12&fields=${FEED_ITEM_FIELDS}`);
+      const data = await res.json();
+      if (!data.ok) {
+        grid.dataset.next = "";
+        if (res.status === 400) reloadForNewDay();  // the cursor's video is gone: a new day
+        return false;
+      }
+      // ranks move while scrolling; a card already shown is never duplicated
+      const html = data.items.filter((v) => !grid.querySelector(`.card[data-vid="${v.id}"]`)).map(cardHtml).join("");
+      grid.insertAdjacentHTML("beforeend", html);
+      grid.dataset.next = data.next || "";
+      return true;
+    } catch(e){
+      console.error(e);
+      return false;
+    } finally {
+      feedLoading = false;
+    }
   }
-  tickUTC();
-  setInterval(tickUTC, 1000);
 
-  function showCenterNotice(msg){
-    const box = document.getElementById("centerNotice");
-    const text = document.getElementById("centerNoticeText");
-    if(!box || !text) return;
-    text.textContent = msg;
-    box.classList.add("show");
-    clearTimeout(window.__centerNoticeTimer);
-    window.__centerNoticeTimer = setTimeout(() => box.classList.remove("show"), 1800);
+  async function boostVideos(vids){
+    const res = await fetch("/api/boost", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ vids }),
+    });
+    return res.json();
   }
 
-  function buildPackText(d){
-    return `Name: ${d.name}
-Ticker: ${d.ticker}
-
-Description:
-${d.description}
+  async function loadMe(){
+    try{
+      const res = await fetch("/api/me", { cache: "no-store" });
+      const data = await res.json();
+      if (data && data.ok) applyMe(data);
+    } catch(e){
+      console.error(e);
+    }
+  }
 
-Source:
-${d.source_url}
-`;
+  // vid -> Promise of its pack; filled for the whole feed by prefetchPacks(),
+  // so the mint flow normally needs no request at all
+  const packs = new Map();
+
+  function fetchPack(vid){
+    if (!packs.has(vid)) {
+      const p = fetch(`/api/pump_pack?vid=${encodeURIComponent(vid)}`)
+        .then((res) => res.json())
+        .then((data) => {
+          if(!data.ok) throw new Error(data.error || "failed");
+          return data;
+        });
+      p.catch(() => packs.delete(vid));  // let a later click retry
+      packs.set(vid, p);
+    }
+    return packs.get(vid);
   }
 
-  async function fetchPack(vid){
-    const res = await fetch(`/api/pump_pack?vid=${encodeURIComponent(vid)}`, { cache: "no-store" });
-    const data = await res.json();
-    if(!data.ok) throw new Error(data.error || "failed");
-    return data;
+  async function prefetchPacks(){
+    try{
+      const res = await fetch("/api/pump_packs");
+      const data = await res.json();
+      Object.entries((data && data.packs) || {}).forEach(([vid, pack]) => {
+        if (!packs.has(vid)) packs.set(vid, Promise.resolve(pack));
+      });
+    } catch(e){
+      console.error(e);
+    }
   }
 
   async function copyTextOnly(vid){
@@ -1023,7 +2312,7 @@ ${d.source_url}
     const data = await fetchPack(vid);
     const imgUrl = data.thumb;
 
-    const imgRes = await fetch(imgUrl, { mode: "cors", cache: "no-store" });
+    const imgRes = await fetch(imgUrl);
     const blob = await imgRes.blob();
 
     if (navigator.clipboard && window.isSecureContext && window.ClipboardItem) {
@@ -1060,6 +2349,38 @@ ${d.source_url}
   }
 
   document.addEventListener("DOMContentLoaded", () => {
+    loadMe();
+    (window.requestIdleCallback || ((fn) => setTimeout(fn, 1)))(prefetchPacks);
+
+    // delegated, so cards added by loadMoreCards() are covered too
+    document.addEventListener("submit", async (ev) => {
+      const form = ev.target;
+      if (!form.matches('form[action="/boost"]')) return;
+      ev.preventDefault();
+      const vid = form.querySelector('input[name="vid"]').value;
+      try{
+        const data = await boostVideos([vid]);
+        if (isNewDay(data)) reloadForNewDay();  // yesterday's card: "unknown video"
+        else if (data.applied && data.applied.length) applyBoost(data);
+        else showCenterNotice((data.rejected && data.rejected[0] && data.rejected[0].error) || data.error || "Boost failed.");
+      } catch(e){
+        console.error(e);
+        form.submit();  // plain POST + redirect fallback
+      }
+    });
+
+    // without IntersectionObserver (very old browsers) the feed stays at the top cards
+    const more = document.getElementById("feedMore");
+    if (more && window.IntersectionObserver) {
+      const fill = async () => {
+        // a short page can leave the sentinel in view, which fires no new entry
+        while (await loadMoreCards() && more.getBoundingClientRect().top < window.innerHeight + 600) {}
+      };
+      new IntersectionObserver((entries) => {
+        if (entries.some((e) => e.isIntersecting)) fill();
+      }, { rootMargin: "600px 0px" }).observe(more);
+    }
+
     const b = document.getElementById("copyPackBtn");
     if (b) b.addEventListener("click", () => copyPack(b.dataset.vid));
 
@@ -1072,13 +2393,21 @@ ${d.source_url}
 
     // ============================
     // ✅ NEWS AUTO REFRESH (NEWS ONLY)
-    // - countdown: "Refresh in 60s" -> ... -> "Refreshing..."
+    // - pushed over /api/events when the browser has EventSource: "Live"
+    // - otherwise (or when the stream is refused) polls /api/news:
+    //   countdown: "Refresh in 60s" -> ... -> "Refreshing..."
     // - updates only #newsList content + top1 effect
     // ============================
     const listEl = document.getElementById("newsList");
     const labelEl = document.getElementById("newsRefreshLabel");
+    let newsVersion = 0;
+    let newsItems = [];
+    let startNewsPolling = () => {};
+    let stopNewsPolling = () => {};
+    let showNews = () => {};
     if (listEl && labelEl) {
       let left = 60;
+      let timer = null;
 
       function renderNews(items){
         if (!items || !items.length) {
@@ -1114,12 +2443,32 @@ ${d.source_url}
         listEl.innerHTML = html;
       }
 
+      // ?since= returns 304 (unchanged), a diff against that version, or the full list
+      function applyNewsDiff(d){
+        const added = d.added || [];
+        const reranked = d.reranked || {};
+        const drop = new Set(d.removed || []);
+        added.forEach((n) => drop.add(n.q));
+        const ranked = [];
+        newsItems.forEach((n, idx) => {
+          if (!drop.has(n.q)) ranked.push([reranked[n.q] || idx + 1, n]);
+        });
+        added.forEach((n) => ranked.push([n.rank, n]));
+        return ranked.sort((a, b) => a[0] - b[0]).map((x) => x[1]);
+      }
+
       async function refreshNews(){
         labelEl.textContent = "Refreshing...";
         try{
-          const res = await fetch("/api/news", { cache: "no-store" });
+          const url = newsVersion ? `/api/news?since=${newsVersion}` : "/api/news";
+          const res = await fetch(url, { cache: "no-store" });
+          if (res.status === 304) return;
           const data = await res.json();
-          if (data && data.ok) renderNews(data.items || []);
+          if (data && data.ok) {
+            newsItems = data.since === newsVersion && data.added ? applyNewsDiff(data) : (data.items || []);
+            newsVersion = data.version || 0;
+            renderNews(newsItems);
+          }
         } catch(e){
           console.error(e);
         } finally {
@@ -1128,64 +2477,772 @@ ${d.source_url}
         }
       }
 
-      setInterval(() => {
-        left -= 1;
-        if (left <= 0) {
-          refreshNews();
-        } else {
-          labelEl.textContent = `Refresh in ${left}s`;
-        }
-      }, 1000);
+      startNewsPolling = () => {
+        if (timer) return;
+        left = 60;
+        labelEl.textContent = `Refresh in ${left}s`;
+        timer = setInterval(() => {
+          left -= 1;
+          if (left <= 0) {
+            refreshNews();
+          } else {
+            labelEl.textContent = `Refresh in ${left}s`;
+          }
+        }, 1000);
+      };
+
+      stopNewsPolling = () => {
+        clearInterval(timer);
+        timer = null;
+        labelEl.textContent = "Live";
+      };
+
+      showNews = renderNews;
+    }
 
-      labelEl.textContent = `Refresh in ${left}s`;
+    // live updates: news snapshots and leaderboard deltas from other users'
+    // boosts; polling stays on until the stream opens and comes back if the
+    // server refuses it (EventSource reconnects on its own otherwise); a
+    // worker with no stream slots to spare says so in data-sse
+    startNewsPolling();
+    if (window.EventSource && document.body.dataset.sse) {
+      const es = new EventSource("/api/events");
+      es.addEventListener("open", () => stopNewsPolling());
+      es.addEventListener("error", () => {
+        if (es.readyState === EventSource.CLOSED) startNewsPolling();
+      });
+      es.addEventListener("news", (ev) => {
+        const data = JSON.parse(ev.data);
+        if (data.items && data.items.length && data.version > newsVersion) {
+          newsVersion = data.version;
+          newsItems = data.items;
+          showNews(newsItems);
+        }
+      });
+      es.addEventListener("board", (ev) => applyBoost(JSON.parse(ev.data)));
     }
   });
-</script>
+"""
+
+HTML = r"""
+<!doctype html>
+<html>
+<head>
+<meta charset="utf-8"/>
+<meta name="viewport" content="width=device-width, initial-scale=1"/>
+<title>Viral Shorts Radar</title>
+<link rel="stylesheet" href="{{ css_url }}"/>
+</head>
+<body data-reset-at="{{ reset_at_ms }}" data-sse="{{ '1' if sse else '' }}">
+<div class="container">
+
+  <div class="nav">
+    <div class="brand">Viral<span>Radar</span></div>
+    <div class="nav-right">
+      <div class="chip">Reset: <b>00:00 UTC</b></div>
+      <div class="chip">Points: <b data-me="points">{{ my_points }}</b></div>
+      <button class="btn secondary" onclick="document.getElementById('how').scrollIntoView({behavior:'smooth'});">How it works</button>
+      <button class="btn" onclick="alert('Wallet connect coming next.\\nWe will keep this smooth & cheap (Solana).');">Connect Wallet</button>
+    </div>
+  </div>
+
+  <div class="hero">
+    <div class="visitorsOverlay" aria-label="Visitors">
+      <div class="chip">Today: <b data-me="visitors_today">-</b></div>
+      <div class="chip">Total: <b data-me="visitors_total">-</b></div>
+    </div>
+
+    <div class="h-title">Boost what goes <span class="accent">viral</span>.</div>
+    <div class="h-sub">
+      A daily radar of trending Shorts — boosted by the community.
+      Spend points now, plug in the token later. Same UX.
+    </div>
+    <div class="cta">
+      <button class="btn" onclick="document.getElementById('feed').scrollIntoView({behavior:'smooth'});">Enter the Feed</button>
+      <button class="btn secondary" onclick="alert('Token utility (draft):\\nBOOST = burn-to-boost attention.\\nBoost 100 -> 70% burn / 20% creator pool / 10% ops.');">Token Draft</button>
+    </div>
+    <div class="smallnote">MVP: Daily reset at 00:00 UTC.</div>
+
+    <div class="countdown-wrap">
+      <div class="countdown">
+        <span class="label">RESET IN</span>
+        <b class="time" id="resetCountdownHero">--:--:--</b>
+        <span style="color:#777; font-size:12px;">(UTC)</span>
+      </div>
+    </div>
+
+    <div style="margin-top:8px; text-align:center; color:#888; font-size:12px;">
+      UTC Now: <b id="utcNow">----</b>
+    </div>
+
+  {{ leader_html }}
+
+  <div class="panel" id="how">
+    <h2>How it works</h2>
+    <div class="how">
+      <div class="step">
+        <b>1) Daily Drop</b>
+        <p>We fetch a fresh Shorts set. Reset at <b>00:00 UTC</b>.</p>
+      </div>
+      <div class="step">
+        <b>2) Boost</b>
+        <p>Boost costs <b>100</b> points. Your boosts are tracked per browser (cookie).</p>
+      </div>
+      <div class="step">
+        <b>3) Rank</b>
+        <p>Ranking is driven by community boosts + time decay. Top videos get <b>HOT</b>.</p>
+      </div>
+      <div class="step">
+        <b>4) Token (next)</b>
+        <p>Points become a token. Boost becomes burn-to-boost attention.</p>
+      </div>
+    </div>
+    <hr class="sep"/>
+    <div class="kpis">
+      <div class="pill">Your Points: <b data-me="points">{{ my_points }}</b></div>
+      <div class="pill">Feed Size: <b>{{ feed_size }}</b></div>
+      <div class="pill">Total Boosts Today: <b data-total-today>{{ total_boosts_today }}</b></div>
+    </div>
+  </div>
+
+  <div id="feed" class="panel" style="padding-bottom:6px;">
+    <h2>🔥 Feed</h2>
+    <div style="color:#888; font-size:12px; text-align:center;">Boosted videos rise. Top 3 show <b>HOT</b>. Your boosts persist in this browser.</div>
+    {% if warming %}
+    <div style="color:#888; font-size:12px; text-align:center; margin-top:8px;">Fetching today’s Shorts… refresh in a moment.</div>
+    {% endif %}
+  </div>
+
+  <div class="grid" data-next="{{ next_cursor }}">
+{{ grid_html }}
+  </div>
+  <div id="feedMore"></div>
+
+  <div class="footer">
+    MVP build. Next: wallet connect + burn-to-boost token flow.
+  </div>
+
+</div>
+
+<div class="centerNotice" id="centerNotice" aria-live="polite">
+  <div id="centerNoticeText">Ready to make a token. Check out the clipboard.</div>
+  <div class="sub">Paste on Pump.fun (Ctrl+V)</div>
+</div>
+
+<script src="{{ js_url }}"></script>
 </body>
 </html>
 """
 
+# -----------------------------
+# Static assets: CSS/JS served by content hash with immutable caching;
+# gzip/brotli variants are built once at import
+# -----------------------------
+ASSETS = {}  # "<name>.<hash>.<ext>" -> {"type", "etag", "identity", "gzip", "br"}
+
+def register_asset(name: str, ext: str, text: str, content_type: str) -> str:
+    body = text.encode("utf-8")
+    digest = hashlib.sha256(body).hexdigest()[:16]
+    fname = f"{name}.{digest}.{ext}"
+    ASSETS[fname] = {
+        "type": content_type,
+        "etag": f'"{digest}"',
+        "identity": body,
+        "gzip": gzip.compress(body, 9),
+        "br": brotli.compress(body, quality=11) if brotli else None,
+    }
+    return f"/assets/{fname}"
+
+CSS_URL = register_asset("app", "css", CSS, "text/css; charset=utf-8")
+JS_URL = register_asset("app", "js", JS, "application/javascript; charset=utf-8")
+
+@app.get("/assets/<fname>")
+def static_asset(fname):
+    asset = ASSETS.get(fname)
+    if asset is None:
+        return "not found", 404
+    if asset["etag"] in request.headers.get("If-None-Match", ""):
+        resp = make_response("", 304)
+    else:
+        accept = request.accept_encodings
+        encoding = "identity"
+        if asset["br"] is not None and accept["br"]:
+            encoding = "br"
+        elif accept["gzip"]:
+            encoding = "gzip"
+        resp = make_response(asset[encoding])
+        resp.headers["Content-Type"] = asset["type"]
+        if encoding != "identity":
+            resp.headers["Content-Encoding"] = encoding
+    resp.headers["ETag"] = asset["etag"]
+    resp.headers["Vary"] = "Accept-Encoding"
+    resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return resp
+
+# -----------------------------
+# Templates are compiled once at import; the shared sections below are
+# rendered once per state change (see render_fragment) and only the
+# per-user values are filled into PAGE_TPL on each request
+# -----------------------------
+NEWS_LIST_HTML = r"""
+              {% for n in news %}
+              <div class="newsItem {% if loop.index == 1 %}top1{% endif %}">
+                <div class="newsRank">{{ loop.index }}</div>
+                <a href="https://www.google.com/search?q={{ n.q }}" target="_blank" rel="noopener noreferrer">
+                  {{ n.title }}
+                </a>
+                <div class="newsMeta">
+                  Sources: <b>{{ n.sources }}</b> • Mentions: <b>{{ n.mentions }}</b>
+                </div>
+              </div>
+              {% endfor %}
+              {% if not news %}
+              <div class="newsItem">
+                <div class="newsRank">1</div>
+                <a href="https://www.google.com/search?q=breaking+news" target="_blank" rel="noopener noreferrer">
+                  No news yet — click to search.
+                </a>
+                <div class="newsMeta">Try again in a moment.</div>
+              </div>
+              {% endif %}
+"""
+
+LEADER_HTML = r"""
+  {% if winner %}
+  <div class="panel">
+    <h2>🏆 Today’s Leader</h2>
+
+    <div class="leaderGrid">
+
+      <!-- ✅ NEWS BOX (ONLY AREA we modify) -->
+      <div class="leaderNews">
+        <div class="how leader-steps" style="align-items:center;">
+          <div class="step">
+            <div class="newsTopRow">
+              <b>📰 Trending News</b>
+            </div>
+            <div class="newsRefresh" id="newsRefreshLabel">Refresh in 60s</div>
+
+            <div class="newsList" id="newsList">
+{{ news_html }}
+            </div>
+
+            <div class="newsHint">Click a title → Google search</div>
+          </div>
+        </div>
+      </div>
+
+      <div class="leaderLeft">
+        <div class="leaderVideo">
+          <img class="thumb" src="{{ winner.thumb_hq }}" />
+          <a class="titlelink" href="{{ winner.url }}" target="_blank">▶ Watch #1 Shorts</a>
+          <div class="meta">Total Boosts: <b data-total="{{ winner.id }}">{{ winner.total_boost }}</b> • Your Boosts: <b data-my-boost="{{ winner.id }}">{{ winner.my_boost }}</b></div>
+          <div class="score" data-score="{{ winner.id }}">🔥 Viral Score: {{ winner.score }}</div>
+
+          <button
+            type="button"
+            class="btn secondary pump"
+            data-vid="{{ winner.id }}"
+            style="display:inline-flex; align-items:center; justify-content:center; gap:10px; text-align:center;"
+          >
+            <svg width="30" height="30" viewBox="0 0 128 128" aria-hidden="true" style="display:block;">
+              <g transform="translate(64 64) rotate(-35) translate(-64 -64)">
+                <rect x="14" y="26" width="100" height="76" rx="38" fill="#0a2f2a" opacity="0.85"/>
+                <rect x="18" y="30" width="92" height="68" rx="34" fill="#ffffff" opacity="0.18"/>
+                <rect x="22" y="34" width="84" height="60" rx="30" fill="#eafff5"/>
+                <path d="M22 94 L22 34 L58 34 L106 94 Z" fill="#22c55e"/>
+                <path d="M58 34 H106 V94 H86 Z" fill="#ffffff"/>
+                <path d="M52 34 H70 L106 94 H88 Z" fill="#0a2f2a" opacity="0.55"/>
+                <path d="M34 76 C29 68 29 56 37 49" fill="none" stroke="#ffffff" stroke-width="8" stroke-linecap="round" opacity="0.85"/>
+                <path d="M46 88 C41 81 41 70 48 63" fill="none" stroke="#ffffff" stroke-width="6" stroke-linecap="round" opacity="0.55"/>
+              </g>
+            </svg>
+            <span style="display:inline-block; line-height:1; text-align:center;">Mint on Pump.fun</span>
+          </button>
+
+          <div style="display:flex; gap:10px; justify-content:center; margin-top:10px;">
+            <button type="button" class="btn secondary" id="copyPackBtn" data-vid="{{ winner.id }}">
+              Copy Pack (Text + Image)
+            </button>
+          </div>
+
+        </div>
+      </div>
+
+      <div class="leaderRight">
+        <div class="how leader-steps">
+          <div class="step">
+            <b>🚀 Boost-to-Rank</b>
+            <p>Boost a video to push it up the feed. The UX is the token utility.</p>
+          </div>
+          <div class="step">
+            <b>🔥 Burn-to-Boost (next)</b>
+            <p>Replace points with token burning. Spend → burn → rank.</p>
+          </div>
+          <div class="step">
+            <b>🗳 Community Picks (next)</b>
+            <p>Daily winner gets highlighted. Later: creator reward pool.</p>
+          </div>
+        </div>
+      </div>
+
+    </div>
+  </div>
+  {% endif %}
+"""
+
+CARD_HTML = r"""
+    <div class="card {% if v.my_boost > 0 %}boosted{% endif %}" data-vid="{{ v.id }}" data-rank="{{ v.rank }}">
+      {% if v.my_boost > 0 %}
+        <div class="badge boosted">BOOSTED</div>
+      {% endif %}
+      {% if v.rank <= 3 %}
+        <div class="badge hot">🔥 HOT</div>
+      {% endif %}
+      {% if v.rank == 1 %}
+        <div class="badge winner">🏆 #1</div>
+      {% endif %}
+
+      <img class="thumb" src="{{ v.thumb }}" loading="lazy" decoding="async" />
+      <a class="titlelink" href="{{ v.url }}" target="_blank">▶ Watch Shorts</a>
+      <div class="meta">Your Boosts: <b data-my-boost="{{ v.id }}">{{ v.my_boost }}</b> • Total: <b data-total="{{ v.id }}">{{ v.total_boost }}</b></div>
+      <div class="score" data-score="{{ v.id }}">🔥 Viral Score: {{ v.score }}</div>
+
+      <form method="post" action="/boost">
+        <input type="hidden" name="vid" value="{{ v.id }}"/>
+        <button class="boost-btn">🚀 BOOST (-100)</button>
+      </form>
+    </div>
+"""
+
+PAGE_TPL = app.jinja_env.from_string(HTML)
+NEWS_LIST_TPL = app.jinja_env.from_string(NEWS_LIST_HTML)
+LEADER_TPL = app.jinja_env.from_string(LEADER_HTML)
+CARD_TPL = app.jinja_env.from_string(CARD_HTML)
+
+FRAGMENT_CACHE = {}
+FRAGMENT_CACHE_MAX = 4096
+
+def render_fragment(tpl, key, **ctx):
+    html = FRAGMENT_CACHE.get(key)
+    if html is None:
+        if len(FRAGMENT_CACHE) >= FRAGMENT_CACHE_MAX:
+            FRAGMENT_CACHE.clear()
+        html = FRAGMENT_CACHE[key] = Markup(tpl.render(**ctx))
+    return html
+
+def render_news_list(news):
+    key = ("news",) + tuple((n["title"], n["q"], n["sources"], n["mentions"]) for n in news)
+    return render_fragment(NEWS_LIST_TPL, key, news=news)
+
+def render_leader(winner, news_html):
+    if not winner:
+        return ""
+    w = winner
+    key = ("leader", w["id"], w["url"], w["thumb_hq"], w["total_boost"], w["my_boost"], w["score"], news_html)
+    return render_fragment(LEADER_TPL, key, winner=winner, news_html=news_html)
+
+def render_grid(items):
+    cards = []
+    for v in items:
+        key = ("card", v["id"], v["url"], v["thumb"], v["rank"], v["total_boost"], v["my_boost"], v["score"])
+        cards.append(render_fragment(CARD_TPL, key, v=v))
+    return Markup("\n".join(cards))
+
+# -----------------------------
+# Page shell: identical for every visitor, keyed by the global state
+# (day, feed order/totals/scores, news) and revalidated with a strong ETag.
+# Per-user values are overlaid client-side from /api/me.
+# -----------------------------
+SHELL = {"key": None, "body": b"", "etag": ""}  # replaced whole, never mutated
+
+def state_version(day: DailyState, items, news_html):
+    return (day.start_ts, day.warming, news_html, boosts_today(day), len(day.videos),
+            tuple((v["id"], v["total_boost"], v["score"]) for v in items))
+
+def render_shell(day: DailyState):
+    global SHELL
+    items, winner = build_view_model(day, limit=FEED_PAGE_SIZE)
+    news_html = render_news_list(get_ranked_news_cached())
+    key = state_version(day, items, news_html)
+    shell = SHELL
+    if shell["key"] == key:
+        return shell
+
+    html = PAGE_TPL.render(
+        leader_html=render_leader(winner, news_html),
+        grid_html=render_grid(items),
+        next_cursor=feed_cursor(day, items[-1]["id"]) if len(day.videos) > len(items) else "",
+        my_points=DEFAULT_POINTS,
+        feed_size=len(day.videos),
+        total_boosts_today=boosts_today(day),
+        reset_at_ms=int((day.start_ts + 86400) * 1000),
+        warming=day.warming,
+        sse=SSE_MAX_CLIENTS > 0,
+        css_url=CSS_URL,
+        js_url=JS_URL,
+    )
+    body = html.encode("utf-8")
+    shell = SHELL = {"key": key, "body": body, "etag": hashlib.sha1(body).hexdigest()}
+    return shell
+
 @app.route("/")
 def home():
-    ensure_daily_reset()
+    day = ensure_daily_reset()
+    shell = render_shell(day)
+    if request.if_none_match.contains(shell["etag"]):
+        resp = make_response("", 304)
+    else:
+        resp = make_response(shell["body"])
+    resp.set_etag(shell["etag"])
+    resp.headers["Cache-Control"] = "public, no-cache"
+    return resp
+
+@app.get("/api/me")
+def api_me():
+    day = ensure_daily_reset()
     uid = get_uid()
-    track_visit(uid)
-
-    me, items, winner = build_view_model(uid)
-    reset_at_ms = int((DAY_START_TS + 86400) * 1000)
-    total_boosts_today = sum(total_boosts(vid) for vid in VIDEOS.keys())
-
-    news = get_ranked_news_cached()
-
-    html = render_template_string(
-        HTML,
-        videos=items,
-        winner=winner,
-        my_points=me["points"],
-        feed_size=len(items),
-        total_boosts_today=total_boosts_today,
-        reset_at_ms=reset_at_ms,
-        visitors_today=VISITOR_TODAY,
-        visitors_total=VISITOR_TOTAL,
-        news=news,
-    )
+    track_visit(uid, day)
+    points, boosts = ledger_user(uid, day)
+    visitors_today, visitors_total = visitor_counts(day)
 
-    resp = make_response(html)
+    resp = jsonify({
+        "ok": True,
+        "points": points,
+        "boosts": boosts,
+        "visitors_today": visitors_today,
+        "visitors_total": visitors_total,
+    })
+    resp.headers["Cache-Control"] = "private, no-store"
     if request.cookies.get(COOKIE_NAME) is None:
         resp.set_cookie(COOKIE_NAME, uid, max_age=31536000, samesite="Lax")
     return resp
 
 @app.route("/boost", methods=["POST"])
 def boost():
-    ensure_daily_reset()
+    # no-JS fallback; the page script uses /api/boost
+    day = ensure_daily_reset()
     uid = get_uid()
-    me = get_user(uid)
+    apply_boosts(day, uid, [request.form.get("vid")])
+    resp = redirect("/")
+    if request.cookies.get(COOKIE_NAME) is None:
+        # the shell sets no cookie and a no-JS browser never calls /api/me
+        resp.set_cookie(COOKIE_NAME, uid, max_age=31536000, samesite="Lax")
+    return resp
+
+@app.post("/api/boost")
+def api_boost():
+    # body: {"vid": "..."} or {"vids": [...]} (JSON or form); returns the new
+    # points, totals/scores of the boosted videos and every rank that moved
+    day = ensure_daily_reset()
+    uid = get_uid()
+
+    data = request.get_json(silent=True)
+    if data is None:
+        vids = request.form.getlist("vids") or [request.form.get("vid")]
+    elif not isinstance(data, dict):
+        return jsonify({"ok": False, "error": "body must be a JSON object"}), 400
+    else:
+        vids = data["vids"] if "vids" in data else [data.get("vid")]
+        if not isinstance(vids, list):
+            return jsonify({"ok": False, "error": "vids must be a list"}), 400
+    vids = [v for v in vids if isinstance(v, str) and v][:BOOST_BATCH_MAX]
+    if not vids:
+        return jsonify({"ok": False, "error": "missing vid"}), 400
+
+    day.sync_shared()
+    lb = day.leaderboard
+    before = {vid: rank for rank, vid in enumerate(lb.top(), start=1)}
+    applied, rejected = apply_boosts(day, uid, vids)
+    ranks = {vid: rank for rank, vid in enumerate(lb.top(), start=1) if before.get(vid) != rank}
+    points, mine = ledger_user(uid, day)
+
+    resp = jsonify({
+        "ok": bool(applied),
+        "points": points,
+        "applied": applied,
+        "rejected": rejected,
+        "videos": {
+            vid: {
+                "total_boost": total_boosts(vid, day),
+                "my_boost": mine.get(vid, 0),
+                "score": viral_score(vid, day),
+                "rank": lb.rank(vid),
+            }
+            for vid in dict.fromkeys(applied)
+        },
+        "ranks": ranks,
+        "winner": lb.winner(),
+        "total_boosts_today": boosts_today(day),
+        "day": int(day.start_ts),
+    })
+    if request.cookies.get(COOKIE_NAME) is None:
+        resp.set_cookie(COOKIE_NAME, uid, max_age=31536000, samesite="Lax")
+    return resp
+
+@app.get("/api/feed")
+def api_feed():
+    # ranked feed in pages: ?cursor= is the previous page's "next", ?limit=
+    # up to FEED_PAGE_MAX, ?fields=id,thumb,... projects the items. The cursor
+    # is a leaderboard key, so pages stay put while ranks shift around them.
+    day = ensure_daily_reset()
+    day.sync_shared()
+    limit = min(max(request.args.get("limit", FEED_PAGE_SIZE, type=int), 1), FEED_PAGE_MAX)
+    fields = [f for f in request.args.get("fields", "").split(",") if f in FEED_FIELDS] or FEED_FIELDS
+
+    after = None
+    if request.args.get("cursor"):
+        after = feed_cursor_key(day, request.args["cursor"])
+        if after is None:
+            return jsonify({"ok": False, "error": "bad or expired cursor"}), 400
+
+    page = day.leaderboard.page(after, limit)
+    items = [feed_item(day, vid, rank) for rank, vid in page]
+    more = bool(page) and page[-1][0] < len(day.leaderboard)
+    resp = jsonify({
+        "ok": True,
+        "items": [{f: v[f] for f in fields} for v in items],
+        "next": feed_cursor(day, page[-1][1]) if more else None,
+        "total": len(day.leaderboard),
+    })
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
+
+@app.get("/api/boost_index/check")
+def api_boost_index_check():
+    # recounts every user's boosts; only routed when VSR_BOOST_INDEX_CHECK=1
+    # (stress_boost.py runs the same check in-process)
+    if not BOOST_INDEX_CHECK:
+        abort(404)
+    day = DAY
+    drift = check_boost_index(day)
+    return jsonify({
+        "ok": not drift,
+        "videos": len(day.boost_totals()),
+        "drift": {vid: {"indexed": a, "actual": b} for vid, (a, b) in drift.items()},
+    })
+
+# -----------------------------
+# Pump packs: a pure function of the vid, so each is built and serialized
+# once; the batch form covers the top of the current feed so the page can
+# prefetch the leader's pack (and its likely successors) in one request.
+# -----------------------------
+@lru_cache(maxsize=4096)
+def pump_pack(vid: str):
+    url = f"https://www.youtube.com/shorts/{vid}"
+    thumb = thumb_url(vid)  # same-origin, so the clipboard copy needs no CORS
+
+    seed = int(hashlib.sha256(vid.encode()).hexdigest()[:8], 16)
+    adjs = ["Viral", "Neon", "Turbo", "Prime", "Hyper"]
+    nouns = ["Capsule", "Coin", "Wave", "Clip", "Buzz"]
+    name = f"{adjs[seed % len(adjs)]}{nouns[(seed // 3) % len(nouns)]}"
+    ticker = hashlib.md5(vid.encode()).hexdigest().upper()[:4]
+
+    desc = (
+        f"{name} (${ticker}) — minted from today’s viral short.\n"
+        f"Source: {url}\n"
+        f"No roadmap. Just vibes."
+    )
+
+    return {
+        "ok": True,
+        "vid": vid,
+        "name": name,
+        "ticker": ticker,
+        "description": desc,
+        "source_url": url,
+        "thumb": thumb
+    }
+
+def json_body(obj):
+    # -> (bytes, strong etag)
+    body = json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return body, hashlib.sha1(body).hexdigest()
+
+@lru_cache(maxsize=4096)
+def pump_pack_body(vid: str):
+    return json_body(pump_pack(vid))
+
+PUMP_PACKS = {"key": None, "identity": b"", "gzip": b"", "etag": ""}  # batch for the feed's top, replaced whole
+
+def pump_packs_body(day: DailyState):
+    # only the rendered top cards: the page uses the leader's pack, and a new
+    # leader nearly always comes from there (anything else is one /api/pump_pack)
+    global PUMP_PACKS
+    day.sync_shared()
+    top = sorted(day.leaderboard.top(FEED_PAGE_SIZE))  # reordering within the top keeps the batch
+    packs = PUMP_PACKS
+    key = (day.start_ts, tuple(top))
+    if packs["key"] != key:
+        body, etag = json_body({"ok": True, "packs": {vid: pump_pack(vid) for vid in top}})
+        packs = PUMP_PACKS = {"key": key, "identity": body, "gzip": gzip.compress(body, 6), "etag": etag}
+    return packs
+
+def json_response(body: bytes, etag: str, cache_control: str, gzipped=None):
+    if request.if_none_match.contains(etag):
+        resp = make_response("", 304)
+    else:
+        if gzipped is not None and request.accept_encodings["gzip"]:
+            resp = make_response(gzipped)
+            resp.headers["Content-Encoding"] = "gzip"
+        else:
+            resp = make_response(body)
+        resp.headers["Content-Type"] = "application/json"
+    resp.set_etag(etag)
+    if gzipped is not None:
+        resp.headers["Vary"] = "Accept-Encoding"
+    resp.headers["Cache-Control"] = cache_control
+    return resp
+
+@app.get("/api/pump_pack")
+def api_pump_pack():
+    vid = request.args.get("vid", "").strip()
+    if not vid:
+        return jsonify({"ok": False, "error": "missing vid"}), 400
+    if not VID_RE.fullmatch(vid):  # before the memo: junk keys would evict real packs
+        return jsonify({"ok": False, "error": "bad vid"}), 400
+    body, etag = pump_pack_body(vid)
+    return json_response(body, etag, "public, max-age=86400")
+
+@app.get("/api/pump_packs")
+def api_pump_packs():
+    # packs of the feed's top FEED_PAGE_SIZE, keyed by vid
+    packs = pump_packs_body(ensure_daily_reset())
+    return json_response(packs["identity"], packs["etag"], "public, no-cache", packs["gzip"])
+
+# -----------------------------
+# Push channel (Server-Sent Events): one broadcaster thread per worker
+# watches the news cache and the (shared) leaderboard and publishes an
+# event only when something changed; open streams just forward them.
+# Each stream holds a server thread, so streams are capped per worker and
+# end after SSE_MAX_AGE_SEC (EventSource reconnects, spreading the load).
+# The cap follows the worker's threads: under gunicorn gthread set
+# VSR_WORKER_THREADS to --threads and at most half of them stream, the rest
+# keep serving pages. The default (one thread, a sync worker) streams
+# nothing and the page doesn't open one. An async worker (gevent/eventlet)
+# spends no thread per stream; set VSR_SSE_MAX directly there.
+# Clients without EventSource, or refused at the cap, keep polling /api/news.
+# -----------------------------
+WORKER_THREADS = int(os.environ.get("VSR_WORKER_THREADS", "1"))
+SSE_MAX_CLIENTS = int(os.environ.get("VSR_SSE_MAX") or WORKER_THREADS // 2)  # per worker
+SSE_TICK_SEC = 1.0
+SSE_HEARTBEAT_SEC = 15
+SSE_MAX_AGE_SEC = 300
+SSE_RETRY_MS = 5000
+SSE = {"clients": 0, "seq": 0}
+SSE_COND = threading.Condition()
+SSE_LOG = deque(maxlen=64)  # (seq, encoded event), newest last
+
+def sse_event(kind: str, data, seq=None) -> bytes:
+    head = f"id: {seq}\n" if seq is not None else ""
+    return f"{head}event: {kind}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode("utf-8")
+
+def sse_publish(kind: str, data):
+    with SSE_COND:
+        SSE["seq"] += 1
+        SSE_LOG.append((SSE["seq"], sse_event(kind, data, SSE["seq"])))
+        SSE_COND.notify_all()
+
+def news_event():
+    return {"version": NEWS_CACHE["version"], "items": NEWS_CACHE["items"]}
+
+def board_state(day: DailyState):
+    # -> {vid: (total boosts, rank)}
+    return {vid: (total_boosts(vid, day), rank) for rank, vid in enumerate(day.leaderboard.top(), start=1)}
+
+def board_event(day: DailyState, state: dict, old=None):
+    # same shape as an /api/boost response minus the per-user fields; with
+    # old=None every video is included (a full snapshot)
+    changed = {vid: v for vid, v in state.items() if old is None or old.get(vid) != v}
+    return {
+        "videos": {vid: {"total_boost": t, "score": viral_score(vid, day), "rank": r} for vid, (t, r) in changed.items()},
+        "ranks": {vid: r for vid, (_, r) in changed.items()},
+        "winner": day.leaderboard.winner(),
+        "total_boosts_today": boosts_today(day),
+        "day": int(day.start_ts),
+    }
+
+def sse_broadcaster():
+    news_version, board_key, board = None, None, {}
+    while True:
+        time.sleep(SSE_TICK_SEC)
+        if not SSE["clients"]:
+            continue
+        try:
+            # the streams replace the page's news poll, so keep the cache warm here
+            if not news_is_fresh():
+                load_news_snapshot()
+                if not news_is_fresh():
+                    start_news_refresh()
+            if NEWS_CACHE["items"] and NEWS_CACHE["version"] != news_version:
+                news_version = NEWS_CACHE["version"]
+                sse_publish("news", news_event())
+
+            day = DAY
+            day.sync_shared()
+            key = (id(day), day.leaderboard.version)
+            if key != board_key:
+                state = board_state(day)
+                if board_key is not None and board_key[0] == id(day):
+                    sse_publish("board", board_event(day, state, board))
+                else:
+                    sse_publish("board", board_event(day, state))
+                board_key, board = key, state
+        except Exception:
+            pass
+
+@app.get("/api/events")
+def api_events():
+    with SSE_COND:
+        if SSE["clients"] >= SSE_MAX_CLIENTS:
+            resp = jsonify({"ok": False, "error": "too many streams"})
+            resp.status_code = 503
+            resp.headers["Retry-After"] = str(SSE_MAX_AGE_SEC)
+            return resp
+        SSE["clients"] += 1
+        seq = SSE["seq"]
+
+    def hello():
+        if not news_is_fresh(NEWS_MAX_STALE_SEC):
+            load_news_snapshot()
+        day = ensure_daily_reset()
+        day.sync_shared()
+        return (f"retry: {SSE_RETRY_MS}\n\n".encode() + sse_event("news", news_event())
+                + sse_event("board", board_event(day, board_state(day))))
+
+    def stream(seq):
+        yield hello()
+        end = time.time() + SSE_MAX_AGE_SEC
+        while time.time() < end:
+            with SSE_COND:
+                if SSE["seq"] == seq:
+                    SSE_COND.wait(SSE_HEARTBEAT_SEC)
+                if SSE_LOG and SSE_LOG[0][0] > seq + 1:
+                    pending = None  # fell behind the log: resend the full state
+                else:
+                    pending = [ev for s, ev in SSE_LOG if s > seq]
+                seq = SSE["seq"]
+            if pending is None:
+                yield hello()
+            else:
+                yield b"".join(pending) or b": ping\n\n"
+
+    def release():
+        with SSE_COND:
+            SSE["clients"] -= 1
+
+    resp = Response(stream(seq), mimetype="text/event-stream")
+    # the server closes the body however the stream ends, including a HEAD
+    # or an early disconnect where the generator never ran (and so would
+    # never reach a finally)
+    resp.call_on_close(release)
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"  # nginx: don't buffer the stream
+    return resp
 
-    vid = request.form.get("vid")
-    if vid in VIDEOS and me["points"] >= 100:
-        me["points"] -= 100
-        me["boosts"][vid] = me["boosts"].get(vid, 0) + 1
-    return redirect("/")
+threading.Thread(target=sse_broadcaster, name="sse-broadcaster", daemon=True).start()
 
 if __name__ == "__main__":
+    if not os.environ.get("VSR_SSE_MAX"):
+        SSE_MAX_CLIENTS = 32  # the dev server starts a thread per request
     app.run()
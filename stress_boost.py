@@ -0,0 +1,85 @@
+# Concurrency stress test: many threads boost through /api/boost and hit
+# /api/me at once, with several threads sharing each uid, then checks that
+# nothing was lost or double-spent.
+#
+#   python stress_boost.py                # 32 threads, 200 users
+#   python stress_boost.py 64 500
+
+import os, sys, random, tempfile, threading
+
+os.environ.setdefault("VSR_STATE_DIR", tempfile.mkdtemp(prefix="vsr-stress-"))
+os.environ.setdefault("VSR_VISITOR_COUNT", "exact")
+import run
+
+VIDEOS = {f"stress{i:05d}": {"id": f"stress{i:05d}", "url": "", "thumb": "", "first_seen": 0.0} for i in range(12)}
+MAX_BOOSTS = run.DEFAULT_POINTS // run.BOOST_COST
+
+def worker(uids, rounds, seed, barrier, visited):
+    rnd = random.Random(seed)
+    client = run.app.test_client()
+    vids = list(VIDEOS)
+    barrier.wait()
+    for _ in range(rounds):
+        uid = rnd.choice(uids)
+        client.set_cookie(run.COOKIE_NAME, uid)
+        if rnd.random() < 0.2:
+            client.get("/api/me")
+            visited.add(uid)
+        else:
+            client.post("/api/boost", json={"vids": rnd.sample(vids, rnd.randint(1, 3))})
+
+def main(n_threads=32, n_users=200, rounds=300):
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible
+    day = run.DAY = run.DailyState(run.utc_midnight_ts(), {})
+    day.install_videos(VIDEOS)
+
+    uids = ["%032x" % i for i in range(n_users)]
+    barrier, visited = threading.Barrier(n_threads), set()
+    threads = [threading.Thread(target=worker, args=(uids, rounds, i, barrier, visited)) for i in range(n_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    errors = []
+    spent = 0
+    for uid, u in day.users.items():
+        if u.points < 0 or len(u.boosts) > MAX_BOOSTS:
+            errors.append(f"{uid}: {len(u.boosts)} boosts, {u.points} points")
+        spent += len(u.boosts)
+    if sum(day.totals) != spent:
+        errors.append(f"totals {sum(day.totals)} != boosts spent {spent}")
+    conn = run.db_connect()  # the shared ledger must agree with this worker's records
+    for uid, points, n in conn.execute(
+            "SELECT u.uid, u.points, COALESCE(SUM(b.n), 0) FROM users u LEFT JOIN boosts b "
+            "ON b.day = u.day AND b.uid = u.uid WHERE u.day = ? GROUP BY u.uid", (int(day.start_ts),)):
+        u = day.users.get(uid)
+        if points < 0 or points != run.DEFAULT_POINTS - run.BOOST_COST * n or u is None or len(u.boosts) != n:
+            errors.append(f"ledger {uid}: {points} points, {n} boosts")
+    conn.close()
+    drift = run.check_boost_index(day)
+    if drift:
+        errors.append(f"boost index drift: {drift}")
+    for vid in VIDEOS:
+        if run.total_boosts(vid, day) != day.totals[day.slot_of[vid]]:
+            errors.append(f"{vid}: shared {run.total_boosts(vid, day)} != local {day.totals[day.slot_of[vid]]}")
+    day.sync_shared()
+    lb = day.leaderboard
+    if sorted(lb.keys) != lb.keys or sorted(lb.key_of.values()) != lb.keys:
+        errors.append("leaderboard keys out of order or out of sync")
+    for vid, key in lb.key_of.items():
+        if -key[0] != run.total_boosts(vid, day):
+            errors.append(f"{vid}: leaderboard {-key[0]} != total {run.total_boosts(vid, day)}")
+    run.db_flush()  # shared visitor counters advance on flush
+    today, total = run.visitor_counts(day)
+    if (today, total) != (len(visited), len(visited)):
+        errors.append(f"visitors today/total {today}/{total} != {len(visited)} distinct uids")
+
+    print(f"{n_threads} threads x {rounds} requests, {len(day.users)} boosters, {spent} boosts, {len(visited)} visitors")
+    for e in errors:
+        print("FAIL", e)
+    print("OK" if not errors else f"{len(errors)} failures")
+    return not errors
+
+if __name__ == "__main__":
+    sys.exit(0 if main(*[int(a) for a in sys.argv[1:]]) else 1)